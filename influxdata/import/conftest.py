@@ -0,0 +1,57 @@
+"""Shared fixtures for import.py tests."""
+
+import importlib
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+# Functions and classes from import.py exercised by the tests
+_TESTED_NAMES = (
+    "_parse_url_with_port_inference",
+    "_validate_test_connection_params",
+    "check_source_connection",
+    "_build_v3_headers",
+    "_parse_v3_databases",
+    "_parse_v3_tables",
+    "_validate_source_params",
+    "get_source_databases_list",
+    "get_source_tables_list",
+    "discover_source",
+    "query_source_influxdb",
+    "extract_credentials",
+    "ImportConfig",
+)
+
+
+@pytest.fixture(scope="session")
+def import_mod():
+    # The module is named "import", which is a Python keyword,
+    # so it has to be loaded through importlib
+    return importlib.import_module("import")
+
+
+@pytest.fixture(scope="session")
+def import_syms(import_mod):
+    return SimpleNamespace(**{name: getattr(import_mod, name) for name in _TESTED_NAMES})
+
+
+@pytest.fixture
+def mock_session_factory():
+    """Build a mock requests session whose get() returns one configurable response."""
+    session = Mock(spec_set=requests.Session)
+    # The response only needs attribute reads, so a plain namespace will do
+    response = SimpleNamespace(raise_for_status=lambda: None)
+
+    def make(headers=None, status_code=200, json_data=None, side_effect=None):
+        response.headers = headers or {}
+        response.status_code = status_code
+        response.content = json.dumps(json_data).encode() if json_data is not None else b""
+        session.get.reset_mock()
+        session.get.return_value = response
+        session.get.side_effect = side_effect
+        return session, response
+
+    return make
@@ -75,12 +75,15 @@
 import base64
 import json
 import os
+import sys
 import time
 import tomllib
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from enum import Enum
+from enum import Enum, IntEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     Any,
@@ -92,8 +95,17 @@ from typing import (
     Tuple,
     runtime_checkable,
 )
+from urllib.parse import urlparse, urlunparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
 
 # Global HTTP session for connection pooling
 _http_session = None
@@ -103,6 +115,7 @@ MAX_RETRIES = 5
 INITIAL_BACKOFF_SECONDS = 1
 MAX_BACKOFF_SECONDS = 16
 REQUEST_TIMEOUT_SECONDS = 30
+HTTP_POOL_SIZE = 32
 STALE_IMPORT_THRESHOLD_SECONDS = 300  # 5 minutes — if last import_state update is older, import is considered stale
 
 # Timestamp offset constants (for boundary adjustments)
@@ -140,6 +153,20 @@ class ImportPauseState(Enum):
     COMPLETED = "completed"
 
 
+class ImportStatus(IntEnum):
+    """Per-table states recorded in the import_state table."""
+
+    PENDING = 0
+    IN_PROGRESS = 1
+    COMPLETED = 2
+    PAUSED = 3
+    CANCELLED = 4
+
+
+# Maps the status strings stored in import_state to ImportStatus members
+_IMPORT_STATUS_BY_NAME = {status.name.lower(): status for status in ImportStatus}
+
+
 @dataclass
 class ImportConfig:
     """Configuration for import plugin"""
@@ -297,7 +324,16 @@ def load_config(
 def get_http_session() -> requests.Session:
     global _http_session
     if _http_session is None:
+        # No adapter-level retries: query_source_influxdb already backs off on
+        # any failed request, including 5xx responses, and test_connection needs
+        # fast feedback
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+        )
         _http_session = requests.Session()
+        _http_session.mount("http://", adapter)
+        _http_session.mount("https://", adapter)
         _http_session.headers.update({"Connection": "keep-alive"})
     return _http_session
 
@@ -346,8 +382,8 @@ def query_source_influxdb(
                 timeout=REQUEST_TIMEOUT_SECONDS,
             )
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return _json_loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
             retry_count += 1
             if retry_count >= MAX_RETRIES:
                 influxdb3_local.error(
@@ -1471,11 +1507,27 @@ def import_table(
     # Create tag rename map
     tag_renames = {conflict: f"{conflict}_tag" for conflict in conflicts}
 
-    # Initialize tracking
-    current_time = (
-        actual_start if config.import_direction == "oldest_first" else actual_end
-    )
-    direction = 1 if config.import_direction == "oldest_first" else -1
+    # Resolve direction-specific window stepping once, outside the import loop
+    window_size = timedelta(seconds=optimal_window_seconds)
+    if config.import_direction == "oldest_first":
+        current_time = actual_start
+        order = "ASC"
+
+        def next_window(cursor: datetime) -> Tuple[datetime, datetime]:
+            return cursor, min(cursor + window_size, actual_end)
+
+        def advance(window_start: datetime, window_end: datetime) -> Tuple[datetime, bool]:
+            return window_end, window_end >= actual_end
+
+    else:
+        current_time = actual_end
+        order = "DESC"
+
+        def next_window(cursor: datetime) -> Tuple[datetime, datetime]:
+            return max(cursor - window_size, actual_start), cursor
+
+        def advance(window_start: datetime, window_end: datetime) -> Tuple[datetime, bool]:
+            return window_start, window_start <= actual_start
 
     rows_imported = 0
     errors = []
@@ -1573,22 +1625,13 @@ def import_table(
             }
 
         # Calculate window
-        if direction > 0:
-            window_start = current_time
-            window_end = current_time + timedelta(seconds=optimal_window_seconds)
-            if window_end > actual_end:
-                window_end = actual_end
-        else:
-            window_end = current_time
-            window_start = current_time - timedelta(seconds=optimal_window_seconds)
-            if window_start < actual_start:
-                window_start = actual_start
+        window_start, window_end = next_window(current_time)
 
         # Query data
         query = f"""
         SELECT * FROM "{measurement}"
         WHERE time >= '{window_start.isoformat()}' AND time <= '{window_end.isoformat()}'
-        ORDER BY time {"ASC" if direction > 0 else "DESC"}
+        ORDER BY time {order}
         """
         try:
             influxdb3_local.info(
@@ -1639,14 +1682,9 @@ def import_table(
                 )
 
             # Move to next window
-            if direction > 0:
-                current_time = window_end
-                if current_time >= actual_end:
-                    break
-            else:
-                current_time = window_start
-                if current_time <= actual_start:
-                    break
+            current_time, finished = advance(window_start, window_end)
+            if finished:
+                break
 
             # Rate limiting
             time.sleep(config.query_interval_ms / 1000.0)
@@ -1736,10 +1774,15 @@ def resume_incomplete_import(
                 "rows_imported": table_info.get("rows_imported", 0),
             }
 
-    # Import remaining tables
+    # Import remaining tables, keeping running totals for the progress reports.
+    # Rows already imported before the checkpoint count towards the total
     import_start = time.time()
-    total_rows = 0
     completed_tables = 0
+    total_rows = sum(
+        state["rows_imported"]
+        for table_name, state in tables_to_resume.items()
+        if table_name in all_measurements
+    )
     all_errors = []
 
     for idx, measurement in enumerate(all_measurements, 1):
@@ -1771,7 +1814,6 @@ def resume_incomplete_import(
             )
             # Add small offset to avoid re-importing the last record
             resume_start = resume_start + timedelta(microseconds=MICROSECOND_OFFSET)
-            total_rows += tables_to_resume[measurement]["rows_imported"]
 
             table_result = import_table(
                 influxdb3_local,
@@ -1818,12 +1860,10 @@ def resume_incomplete_import(
                 task_id,
             )
 
-        if table_result["status"] in ["completed"]:
+        if table_result["status"] == "completed":
             completed_tables += 1
             total_rows += table_result.get("rows_imported", 0)
-
-        if "errors" in table_result:
-            all_errors.extend(table_result["errors"])
+        all_errors.extend(table_result.get("errors", []))
 
         influxdb3_local.info(
             f"[{task_id}] Progress: {completed_tables}/{len(all_measurements)} tables completed"
@@ -1980,7 +2020,9 @@ def start_import(influxdb3_local, config: ImportConfig, credentials: Dict[str, O
     Start a new import process
     Returns import_id and initial status
     """
-    import_id = str(uuid.uuid4())
+    # hex form skips the dash formatting; interning shares the one string
+    # across the many state queries and log lines that embed it
+    import_id = sys.intern(uuid.uuid4().hex)
 
     influxdb3_local.info(f"[{task_id}] Starting import {import_id}")
     influxdb3_local.info(
@@ -2153,10 +2195,10 @@ def _run_import(
     except Exception as e:
         influxdb3_local.warn(f"[{task_id}] Failed to initialize import state: {e}")
 
-    # Import each table
+    # Import each table, keeping running totals for the progress reports
     import_start = time.time()
-    total_rows = 0
     completed_tables = 0
+    total_rows = 0
     all_errors = []
 
     for idx, measurement in enumerate(measurements, 1):
@@ -2175,13 +2217,13 @@ def _run_import(
             task_id,
             metadata=metadata,
         )
-
-        if table_result["status"] in ["completed"]:
+        if table_result["status"] == "completed":
             completed_tables += 1
-            total_rows += table_result.get("rows_imported", 0)
-        elif table_result["status"] == "cancelled":
+        total_rows += table_result.get("rows_imported", 0)
+        all_errors.extend(table_result.get("errors", []))
+
+        if table_result["status"] == "cancelled":
             # Import was cancelled by user, stop immediately and return report
-            total_rows += table_result.get("rows_imported", 0)
             influxdb3_local.info(
                 f"[{task_id}] Import cancelled by user on table '{table_result['measurement']}'"
             )
@@ -2204,7 +2246,6 @@ def _run_import(
             }
         elif table_result["status"] == "paused":
             # Import was paused by user, stop immediately and return report
-            total_rows += table_result.get("rows_imported", 0)
             influxdb3_local.info(
                 f"[{task_id}] Import paused by user on table '{table_result['measurement']}'"
             )
@@ -2226,9 +2267,6 @@ def _run_import(
                 "message": f"Import paused by user. Completed {completed_tables}/{total_tables} tables, {total_rows} rows imported.",
             }
 
-        if "errors" in table_result:
-            all_errors.extend(table_result["errors"])
-
         influxdb3_local.info(
             f"[{task_id}] Progress: {completed_tables}/{total_tables} tables completed"
         )
@@ -2276,6 +2314,15 @@ def _run_import(
     return report
 
 
+def _is_true(value: Any) -> bool:
+    """Decode a boolean field from a query result row (a bool, or a "true"/"false" string)."""
+    if value is True:
+        return True
+    if isinstance(value, str):
+        return value.lower() == "true"
+    return False
+
+
 def get_import_pause_state(
     influxdb3_local, import_id: str, task_id: str
 ) -> ImportPauseState:
@@ -2304,16 +2351,13 @@ def get_import_pause_state(
 
         row = result[0]
 
-        canceled_value = row.get("canceled", False)
-        if str(canceled_value).lower() == "true":
+        if _is_true(row.get("canceled", False)):
             return ImportPauseState.CANCELLED
 
-        completed_value = row.get("completed", False)
-        if str(completed_value).lower() == "true":
+        if _is_true(row.get("completed", False)):
             return ImportPauseState.COMPLETED
 
-        paused_value = row.get("paused", False)
-        if str(paused_value).lower() == "true":
+        if _is_true(row.get("paused", False)):
             return ImportPauseState.PAUSED
 
         return ImportPauseState.RUNNING
@@ -2427,7 +2471,7 @@ def resume_import(
             status_query = f"""
             SELECT status, table_name
             FROM 'import_state'
-            WHERE import_id = '{import_id}'
+            WHERE import_id = '{import_id}' AND table_name != 'all'
             ORDER BY time DESC
             LIMIT 100
             """
@@ -2457,7 +2501,7 @@ def resume_import(
         non_completed_tables = [
             table
             for table, status in latest_states.items()
-            if table != "all" and status not in ["completed", "cancelled"]
+            if status not in ["completed", "cancelled"]
         ]
 
         if not non_completed_tables:
@@ -2486,7 +2530,7 @@ def resume_import(
         query = f"""
         SELECT import_id, table_name, status, rows_imported, time, paused_at_time
         FROM 'import_state'
-        WHERE import_id = '{import_id}'
+        WHERE import_id = '{import_id}' AND table_name != 'all'
         ORDER BY time DESC
         """
         result = influxdb3_local.query(query)
@@ -2512,10 +2556,6 @@ def resume_import(
         # Find tables that need to be resumed (paused or in_progress)
         incomplete_tables = []
         for table_name, state in latest_states.items():
-            # Skip special marker entries
-            if table_name == "all":
-                continue
-
             # Include paused and in_progress tables
             if state["status"] in ["paused", "in_progress"]:
                 incomplete_tables.append(state)
@@ -2530,7 +2570,8 @@ def resume_import(
             }
 
         influxdb3_local.info(
-            f"[{task_id}] Found {incomplete_tables} incomplete tables to resume for import {import_id}: {incomplete_tables}"
+            f"[{task_id}] Found {len(incomplete_tables)} incomplete tables to resume for import {import_id}: "
+            f"{', '.join(t['table_name'] for t in incomplete_tables)}"
         )
 
         # Resume the import using resume_incomplete_import
@@ -2599,72 +2640,53 @@ def get_import_stats(influxdb3_local, import_id: str, task_id: str) -> Dict[str,
         """
         config_result = influxdb3_local.query(config_query)
 
-        # Process state records - get latest state for each table
-        latest_table_states = {}
-        earliest_time = None
-        latest_time = None
+        # Records are ordered by time DESC, so the time boundaries are the
+        # last and first rows and the first row seen per table is its latest state
+        earliest_time = state_result[-1].get("time")
+        latest_time = state_result[0].get("time")
 
+        latest_table_states = {}
         for row in state_result:
             table_name = row.get("table_name")
-            record_time = row.get("time")
-
-            # Track time boundaries
-            if earliest_time is None or record_time < earliest_time:
-                earliest_time = record_time
-            if latest_time is None or record_time > latest_time:
-                latest_time = record_time
-
-            # Keep only the latest state for each table
             if table_name not in latest_table_states:
                 latest_table_states[table_name] = {
                     "table_name": table_name,
                     "status": row.get("status"),
                     "rows_imported": row.get("rows_imported", 0),
-                    "last_update": record_time,
+                    "last_update": row.get("time"),
                     "paused_at_time": row.get("paused_at_time", ""),
                 }
 
-        # Calculate statistics
-        total_tables = len([t for t in latest_table_states.keys() if t != "all"])
-        completed_tables = len(
-            [
-                t
-                for t, s in latest_table_states.items()
-                if t != "all" and s["status"] == "completed"
-            ]
-        )
-        in_progress_tables = len(
-            [
-                t
-                for t, s in latest_table_states.items()
-                if t != "all" and s["status"] == "in_progress"
-            ]
-        )
-        paused_tables = len(
-            [
-                t
-                for t, s in latest_table_states.items()
-                if t != "all" and s["status"] == "paused"
-            ]
-        )
-        cancelled_tables = len(
-            [
-                t
-                for t, s in latest_table_states.items()
-                if t != "all" and s["status"] == "cancelled"
-            ]
-        )
-        pending_tables = len(
-            [
-                t
-                for t, s in latest_table_states.items()
-                if t != "all" and s["status"] == "pending"
-            ]
-        )
+        # Calculate statistics and per-table details in a single pass over
+        # table names in sorted order (exclude 'all' marker)
+        status_counts = [0] * len(ImportStatus)
+        total_tables = 0
+        total_rows_imported = 0
+        table_details = []
+        for t in sorted(latest_table_states):
+            if t == "all":
+                continue
+            s = latest_table_states[t]
+            total_tables += 1
+            status = _IMPORT_STATUS_BY_NAME.get(s["status"])
+            if status is not None:
+                status_counts[status] += 1
+            total_rows_imported += s["rows_imported"]
+            table_details.append(
+                {
+                    "table_name": s["table_name"],
+                    "status": s["status"],
+                    "rows_imported": s["rows_imported"],
+                    "last_update": s["last_update"],
+                    "paused_at_time": s["paused_at_time"] if s["paused_at_time"] else None,
+                }
+            )
 
-        total_rows_imported = sum(
-            s["rows_imported"] for t, s in latest_table_states.items() if t != "all"
-        )
+        completed_tables = status_counts[ImportStatus.COMPLETED]
+        in_progress_tables = status_counts[ImportStatus.IN_PROGRESS]
+        paused_tables = status_counts[ImportStatus.PAUSED]
+        cancelled_tables = status_counts[ImportStatus.CANCELLED]
+        pending_tables = status_counts[ImportStatus.PENDING]
 
         # Determine overall import status
         overall_status = "unknown"
@@ -2674,9 +2696,9 @@ def get_import_stats(influxdb3_local, import_id: str, task_id: str) -> Dict[str,
 
         if pause_result and len(pause_result) > 0:
             pause_state = pause_result[0]
-            is_cancelled = str(pause_state.get("canceled", False)).lower() == "true"
-            is_completed = str(pause_state.get("completed", False)).lower() == "true"
-            is_paused = str(pause_state.get("paused", False)).lower() == "true"
+            is_cancelled = _is_true(pause_state.get("canceled", False))
+            is_completed = _is_true(pause_state.get("completed", False))
+            is_paused = _is_true(pause_state.get("paused", False))
 
         if (
             is_cancelled
@@ -2693,22 +2715,6 @@ def get_import_stats(influxdb3_local, import_id: str, task_id: str) -> Dict[str,
         else:
             overall_status = "unknown"
 
-        # Build per-table details (exclude 'all' marker)
-        table_details = [
-            {
-                "table_name": s["table_name"],
-                "status": s["status"],
-                "rows_imported": s["rows_imported"],
-                "last_update": s["last_update"],
-                "paused_at_time": s["paused_at_time"] if s["paused_at_time"] else None,
-            }
-            for t, s in latest_table_states.items()
-            if t != "all"
-        ]
-
-        # Sort by table name
-        table_details.sort(key=lambda x: x["table_name"])
-
         # Build config summary
         config_summary = None
         if config_result and len(config_result) > 0:
@@ -2858,6 +2864,7 @@ def _validate_source_params(body_data: Dict[str, Any]) -> Optional[Dict[str, Any
     return None
 
 
+@lru_cache(maxsize=256)
 def _parse_url_with_port_inference(source_url: str) -> str:
     """Parse URL and infer port from scheme if not specified.
 
@@ -2867,8 +2874,6 @@ def _parse_url_with_port_inference(source_url: str) -> str:
     Returns:
         URL with port included (inferred from scheme if missing)
     """
-    from urllib.parse import urlparse, urlunparse
-
     source_url = source_url.rstrip("/")
     try:
         parsed = urlparse(source_url)
@@ -2887,13 +2892,12 @@ def _parse_url_with_port_inference(source_url: str) -> str:
         return source_url
 
 
-def _build_v1_headers(credentials: Dict[str, Optional[str]]) -> Dict[str, str]:
-    """Build headers for InfluxDB v1 API requests."""
+@lru_cache(maxsize=64)
+def _v1_headers(
+    username: Optional[str], password: Optional[str], token: Optional[str]
+) -> Dict[str, str]:
+    """Build (and cache) InfluxDB v1 headers for a credential set. Do not mutate."""
     headers = {"Content-Type": "application/json"}
-    username = credentials.get("source_username")
-    password = credentials.get("source_password")
-    token = credentials.get("source_token")
-
     if username and password:
         creds = f"{username}:{password}"
         encoded = base64.b64encode(creds.encode()).decode()
@@ -2903,6 +2907,32 @@ def _build_v1_headers(credentials: Dict[str, Optional[str]]) -> Dict[str, str]:
     return headers
 
 
+@lru_cache(maxsize=64)
+def _v2_auth_headers(token: Optional[str]) -> Dict[str, str]:
+    """Build (and cache) InfluxDB v2 auth headers for a token. Do not mutate."""
+    return {"Authorization": f"Token {token}"} if token else {}
+
+
+@lru_cache(maxsize=64)
+def _v3_headers(token: Optional[str]) -> Dict[str, str]:
+    """Build (and cache) InfluxDB v3 headers for a token. Do not mutate."""
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+def _build_v1_headers(credentials: Dict[str, Optional[str]]) -> Dict[str, str]:
+    """Build headers for InfluxDB v1 API requests."""
+    return dict(
+        _v1_headers(
+            credentials.get("source_username"),
+            credentials.get("source_password"),
+            credentials.get("source_token"),
+        )
+    )
+
+
 def _build_v2_headers(
     credentials: Dict[str, Optional[str]],
     extra_headers: Dict[str, str] | None = None,
@@ -2911,19 +2941,17 @@ def _build_v2_headers(
     headers = {}
     if extra_headers:
         headers.update(extra_headers)
-    token = credentials.get("source_token")
-    if token:
-        headers["Authorization"] = f"Token {token}"
+    headers.update(_v2_auth_headers(credentials.get("source_token")))
     return headers
 
 
 def _build_v3_headers(credentials: Dict[str, Optional[str]]) -> Dict[str, str]:
     """Build headers for InfluxDB v3 API requests."""
-    headers = {"Content-Type": "application/json"}
-    token = credentials.get("source_token")
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    return headers
+    return dict(_v3_headers(credentials.get("source_token")))
+
+
+# Schemas whose tables are engine internals rather than user data
+_V3_EXCLUDED_SCHEMAS = frozenset({"system", "information_schema"})
 
 
 def _parse_v1_series_values(result: Dict[str, Any]) -> List[str]:
@@ -2935,12 +2963,14 @@ def _parse_v1_series_values(result: Dict[str, Any]) -> List[str]:
     Returns:
         List of values from first column of first series
     """
-    if "results" not in result or len(result["results"]) == 0:
+    results = result.get("results")
+    if not results:
         return []
-    series = result["results"][0].get("series", [])
-    if not series or "values" not in series[0]:
+    series = results[0].get("series")
+    if not series:
         return []
-    return [row[0] for row in series[0]["values"]]
+    values = series[0].get("values")
+    return [row[0] for row in values] if values else []
 
 
 def _parse_v3_databases(result: List[Dict[str, Any]]) -> List[str]:
@@ -2952,12 +2982,11 @@ def _parse_v3_databases(result: List[Dict[str, Any]]) -> List[str]:
     Returns:
         List of database names, excluding _internal
     """
-    databases = []
-    for row in result:
-        db_name = row.get("iox::database")
-        if db_name and db_name != "_internal":
-            databases.append(db_name)
-    return databases
+    return [
+        db_name
+        for db_name in (row.get("iox::database") for row in result)
+        if db_name and db_name != "_internal"
+    ]
 
 
 def _parse_v3_tables(result: List[Dict[str, Any]]) -> List[str]:
@@ -2969,14 +2998,11 @@ def _parse_v3_tables(result: List[Dict[str, Any]]) -> List[str]:
     Returns:
         List of table names from iox schema only
     """
-    excluded_schemas = {"system", "information_schema"}
-    tables = []
-    for row in result:
-        schema = row.get("table_schema")
-        table_name = row.get("table_name")
-        if schema not in excluded_schemas and table_name:
-            tables.append(table_name)
-    return tables
+    return [
+        row["table_name"]
+        for row in result
+        if row.get("table_schema") not in _V3_EXCLUDED_SCHEMAS and row.get("table_name")
+    ]
 
 
 def check_source_connection(
@@ -3065,7 +3091,7 @@ def get_source_databases_list(
             )
             response.raise_for_status()
 
-            databases = _parse_v1_series_values(response.json())
+            databases = _parse_v1_series_values(_json_loads(response.content))
             databases = [db for db in databases if db not in ["_internal"]]
             return {"databases": sorted(databases)}
 
@@ -3081,7 +3107,7 @@ def get_source_databases_list(
             )
             response.raise_for_status()
 
-            databases = _parse_v1_series_values(response.json())
+            databases = _parse_v1_series_values(_json_loads(response.content))
             databases = [db for db in databases if db not in ["_internal"]]
             return {"databases": sorted(databases)}
 
@@ -3096,12 +3122,12 @@ def get_source_databases_list(
             )
             response.raise_for_status()
 
-            databases = _parse_v3_databases(response.json())
+            databases = _parse_v3_databases(_json_loads(response.content))
             return {"databases": sorted(databases)}
         else:
             return {"error": f"Unsupported version: {influxdb_version}"}
 
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         return {"error": str(e)}
 
 
@@ -3148,7 +3174,7 @@ def get_source_tables_list(
             )
             response.raise_for_status()
 
-            tables = _parse_v1_series_values(response.json())
+            tables = _parse_v1_series_values(_json_loads(response.content))
             return {"tables": sorted(tables)}
 
         elif influxdb_version == 2:
@@ -3163,7 +3189,7 @@ def get_source_tables_list(
             )
             response.raise_for_status()
 
-            tables = _parse_v1_series_values(response.json())
+            tables = _parse_v1_series_values(_json_loads(response.content))
             return {"tables": sorted(tables)}
 
         elif influxdb_version == 3:
@@ -3177,15 +3203,143 @@ def get_source_tables_list(
             )
             response.raise_for_status()
 
-            tables = _parse_v3_tables(response.json())
+            tables = _parse_v3_tables(_json_loads(response.content))
             return {"tables": sorted(tables)}
         else:
             return {"error": f"Unsupported version: {influxdb_version}"}
 
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         return {"error": str(e)}
 
 
+def discover_source(
+    body_data: Dict[str, Any],
+    credentials: Dict[str, Optional[str]],
+    session: requests.Session = None,
+) -> Dict[str, Any]:
+    """Run connection test, database listing and table listing concurrently.
+
+    Combines the test_connection, databases and tables actions so the UI pays
+    a single round trip instead of three. Tables are only listed when
+    source_database is provided.
+
+    Args:
+        body_data: Dict containing source_url, influxdb_version and optional source_database
+        credentials: Dict containing auth credentials (source_token, source_username, source_password)
+        session: Optional requests.Session for dependency injection (testing)
+
+    Returns:
+        Dict with connection, databases and tables results (tables is None if not requested)
+    """
+    if session is None:
+        session = get_http_session()
+
+    # Each helper validates (and may normalize) its own copy of the body
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        connection_future = executor.submit(
+            check_source_connection, dict(body_data), session
+        )
+        databases_future = executor.submit(
+            get_source_databases_list, dict(body_data), credentials, session
+        )
+        tables_future = (
+            executor.submit(get_source_tables_list, dict(body_data), credentials, session)
+            if body_data.get("source_database")
+            else None
+        )
+
+        return {
+            "connection": connection_future.result(),
+            "databases": databases_future.result(),
+            "tables": tables_future.result() if tables_future else None,
+        }
+
+
+def _handle_start(influxdb3_local, import_id, credentials, request_body, args, task_id):
+    # Parse request body if JSON
+    body_data: dict = _json_loads(request_body) if request_body else {}
+
+    try:
+        config = load_config(influxdb3_local, task_id, args, body_data)
+    except Exception as e:
+        return {"status": "error", "error": f"Configuration error: {e}"}
+
+    # Start import
+    return start_import(influxdb3_local, config, credentials, task_id)
+
+
+def _handle_status(influxdb3_local, import_id, credentials, request_body, args, task_id):
+    if not import_id:
+        return {"status": "error", "error": "import_id required"}
+    return get_import_stats(influxdb3_local, import_id, task_id)
+
+
+def _handle_pause(influxdb3_local, import_id, credentials, request_body, args, task_id):
+    if not import_id:
+        return {"status": "error", "error": "import_id required"}
+    return pause_import(influxdb3_local, import_id, task_id)
+
+
+def _handle_resume(influxdb3_local, import_id, credentials, request_body, args, task_id):
+    if not import_id:
+        return {"status": "error", "error": "import_id required"}
+    return resume_import(influxdb3_local, import_id, credentials, task_id)
+
+
+def _handle_cancel(influxdb3_local, import_id, credentials, request_body, args, task_id):
+    if not import_id:
+        return {"status": "error", "error": "import_id required"}
+    return cancel_import(influxdb3_local, import_id, task_id)
+
+
+def _handle_test_connection(influxdb3_local, import_id, credentials, request_body, args, task_id):
+    body_data = _json_loads(request_body) if request_body else {}
+    result = check_source_connection(body_data)
+    if not result.get("success"):
+        influxdb3_local.error(f"[{task_id}] test_connection failed: {result.get('message')}")
+    return result
+
+
+def _handle_databases(influxdb3_local, import_id, credentials, request_body, args, task_id):
+    body_data = _json_loads(request_body) if request_body else {}
+    result = get_source_databases_list(body_data, credentials)
+    if result.get("error"):
+        influxdb3_local.error(f"[{task_id}] databases failed: {result.get('error')}")
+    return result
+
+
+def _handle_tables(influxdb3_local, import_id, credentials, request_body, args, task_id):
+    body_data = _json_loads(request_body) if request_body else {}
+    result = get_source_tables_list(body_data, credentials)
+    if result.get("error"):
+        influxdb3_local.error(f"[{task_id}] tables failed: {result.get('error')}")
+    return result
+
+
+def _handle_discover(influxdb3_local, import_id, credentials, request_body, args, task_id):
+    body_data = _json_loads(request_body) if request_body else {}
+    result = discover_source(body_data, credentials)
+    if not result["connection"].get("success"):
+        influxdb3_local.error(
+            f"[{task_id}] discover connection failed: {result['connection'].get('message')}"
+        )
+    return result
+
+
+# Action name -> handler(influxdb3_local, import_id, credentials, request_body, args, task_id)
+_ACTION_HANDLERS = {
+    "start": _handle_start,
+    "status": _handle_status,
+    "pause": _handle_pause,
+    "resume": _handle_resume,
+    "cancel": _handle_cancel,
+    "test_connection": _handle_test_connection,
+    "databases": _handle_databases,
+    "tables": _handle_tables,
+    "discover": _handle_discover,
+}
+
+
 def process_request(
     influxdb3_local, query_parameters, request_headers, request_body, args=None
 ):
@@ -3198,6 +3352,7 @@ def process_request(
     - POST /api/v3/import?action=pause&import_id=<id> - Pause import
     - POST /api/v3/import?action=resume&import_id=<id> - Resume import
     - POST /api/v3/import?action=cancel&import_id=<id> - Cancel import
+    - POST /api/v3/import?action=discover - Test connection and list databases/tables
     """
     task_id: str = str(uuid.uuid4())
     influxdb3_local.info(f"[{task_id}] Import plugin invoked")
@@ -3206,86 +3361,19 @@ def process_request(
     action = query_parameters.get("action", "start")
     import_id = query_parameters.get("import_id")
 
+    handler = _ACTION_HANDLERS.get(action)
+    if handler is None:
+        return {
+            "status": "error",
+            "error": f"Unknown action: {action}",
+            "available_actions": list(_ACTION_HANDLERS),
+        }
+
     # Extract credentials from request headers (available for all actions)
     credentials = extract_credentials(request_headers)
 
     try:
-        # Handle different actions
-        if action == "start":
-            # Parse request body if JSON
-            body_data: dict = json.loads(request_body) if request_body else {}
-
-            try:
-                config = load_config(influxdb3_local, task_id, args, body_data)
-            except Exception as e:
-                return {"status": "error", "error": f"Configuration error: {e}"}
-
-            # Start import
-            return start_import(influxdb3_local, config, credentials, task_id)
-
-        elif action == "status":
-            if not import_id:
-                return {"status": "error", "error": "import_id required"}
-            return get_import_stats(influxdb3_local, import_id, task_id)
-
-        elif action == "pause":
-            if not import_id:
-                return {"status": "error", "error": "import_id required"}
-            return pause_import(influxdb3_local, import_id, task_id)
-
-        elif action == "resume":
-            if not import_id:
-                return {"status": "error", "error": "import_id required"}
-
-            return resume_import(
-                influxdb3_local,
-                import_id,
-                credentials,
-                task_id,
-            )
-
-        elif action == "cancel":
-            if not import_id:
-                return {"status": "error", "error": "import_id required"}
-            return cancel_import(influxdb3_local, import_id, task_id)
-
-        elif action == "test_connection":
-            body_data = json.loads(request_body) if request_body else {}
-            result = check_source_connection(body_data)
-            if not result.get("success"):
-                influxdb3_local.error(f"[{task_id}] test_connection failed: {result.get('message')}")
-            return result
-
-        elif action == "databases":
-            body_data = json.loads(request_body) if request_body else {}
-            result = get_source_databases_list(body_data, credentials)
-            if result.get("error"):
-                influxdb3_local.error(f"[{task_id}] databases failed: {result.get('error')}")
-            return result
-
-        elif action == "tables":
-            body_data = json.loads(request_body) if request_body else {}
-            result = get_source_tables_list(body_data, credentials)
-            if result.get("error"):
-                influxdb3_local.error(f"[{task_id}] tables failed: {result.get('error')}")
-            return result
-
-        else:
-            return {
-                "status": "error",
-                "error": f"Unknown action: {action}",
-                "available_actions": [
-                    "start",
-                    "status",
-                    "pause",
-                    "resume",
-                    "cancel",
-                    "test_connection",
-                    "databases",
-                    "tables",
-                ],
-            }
-
+        return handler(influxdb3_local, import_id, credentials, request_body, args, task_id)
     except Exception as e:
         influxdb3_local.error(f"[{task_id}] Failed to process request: {e}")
         return {"status": "error", "error": str(e)}
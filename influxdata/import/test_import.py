@@ -1,146 +1,102 @@
 """Tests for import.py functions."""
 
-import pytest
-from unittest.mock import Mock, patch
-
-# Note: The module is named "import" which is a Python keyword
-# We need to use importlib to import it
-import importlib
-import_module = importlib.import_module("import")
-
-_parse_url_with_port_inference = import_module._parse_url_with_port_inference
-_validate_test_connection_params = import_module._validate_test_connection_params
-check_source_connection = import_module.check_source_connection
-_build_v3_headers = import_module._build_v3_headers
-_parse_v3_databases = import_module._parse_v3_databases
-_parse_v3_tables = import_module._parse_v3_tables
-_validate_source_params = import_module._validate_source_params
-get_source_databases_list = import_module.get_source_databases_list
-get_source_tables_list = import_module.get_source_tables_list
-query_source_influxdb = import_module.query_source_influxdb
-ImportConfig = import_module.ImportConfig
-
-
-class TestParseUrlWithPortInference:
-    """Tests for _parse_url_with_port_inference."""
+import json
+from types import SimpleNamespace
 
-    def test_url_with_explicit_port_unchanged(self):
-        result = _parse_url_with_port_inference("http://localhost:8086")
-        assert result == "http://localhost:8086"
+import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+from unittest.mock import Mock
 
-    def test_http_url_infers_port_80(self):
-        result = _parse_url_with_port_inference("http://localhost")
-        assert result == "http://localhost:80"
 
-    def test_https_url_infers_port_443(self):
-        result = _parse_url_with_port_inference("https://localhost")
-        assert result == "https://localhost:443"
+# Expected check_source_connection results shared across tests
+_EXP_2_7_OSS = {"success": True, "version": "2.7.0", "build": "OSS"}
+_EXP_NOT_INFLUX = {"success": False, "message": "Not an InfluxDB instance"}
+_EXP_MISSING_URL = {"success": False, "message": "source_url is required"}
+_EXP_UNDETERMINED = {"success": False, "message": "Unable to determine InfluxDB version"}
 
-    def test_url_with_path_preserved(self):
-        result = _parse_url_with_port_inference("http://localhost:8086/api")
-        assert result == "http://localhost:8086/api"
 
-    def test_trailing_slash_removed(self):
-        result = _parse_url_with_port_inference("http://localhost:8086/")
-        assert result == "http://localhost:8086"
+class TestParseUrlWithPortInference:
+    """Tests for _parse_url_with_port_inference."""
 
-    def test_https_with_explicit_port(self):
-        result = _parse_url_with_port_inference("https://myserver.com:9999")
-        assert result == "https://myserver.com:9999"
+    @pytest.mark.parametrize("url,expected", [
+        ("http://localhost:8086", "http://localhost:8086"),
+        ("http://localhost", "http://localhost:80"),
+        ("https://localhost", "https://localhost:443"),
+        ("http://localhost:8086/api", "http://localhost:8086/api"),
+        ("http://localhost:8086/", "http://localhost:8086"),
+        ("https://myserver.com:9999", "https://myserver.com:9999"),
+    ])
+    def test_parse(self, url, expected, import_syms):
+        assert import_syms._parse_url_with_port_inference(url) == expected
 
 
 class TestValidateTestConnectionParams:
     """Tests for _validate_test_connection_params."""
 
-    def test_valid_source_url_returns_none(self):
-        result = _validate_test_connection_params({"source_url": "http://localhost:8086"})
-        assert result is None
-
-    def test_missing_source_url_returns_error(self):
-        result = _validate_test_connection_params({})
-        assert result == {"message": "source_url is required"}
-
-    def test_empty_source_url_returns_error(self):
-        result = _validate_test_connection_params({"source_url": ""})
-        assert result == {"message": "source_url is required"}
-
-    def test_whitespace_source_url_returns_error(self):
-        result = _validate_test_connection_params({"source_url": "   "})
-        assert result == {"message": "source_url is required"}
-
-    def test_none_source_url_returns_error(self):
-        result = _validate_test_connection_params({"source_url": None})
-        assert result == {"message": "source_url is required"}
+    @pytest.mark.parametrize("body_data,expected", [
+        ({"source_url": "http://localhost:8086"}, None),
+        ({}, {"message": "source_url is required"}),
+        ({"source_url": ""}, {"message": "source_url is required"}),
+        ({"source_url": "   "}, {"message": "source_url is required"}),
+        ({"source_url": None}, {"message": "source_url is required"}),
+    ])
+    def test_validate(self, body_data, expected, import_syms):
+        assert import_syms._validate_test_connection_params(body_data) == expected
 
 
 class TestCheckSourceConnection:
     """Tests for check_source_connection."""
 
-    def test_influxdb_detected_returns_success_with_version_build(self):
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.headers = {
+    def test_influxdb_detected_returns_success_with_version_build(self, import_syms, mock_session_factory):
+        mock_session, _ = mock_session_factory(headers={
             "X-Influxdb-Version": "2.7.0",
             "X-Influxdb-Build": "OSS",
-        }
-        mock_session.get.return_value = mock_response
+        })
 
-        result = check_source_connection(
+        result = import_syms.check_source_connection(
             {"source_url": "http://localhost:8086"},
             session=mock_session,
         )
 
-        assert result == {"success": True, "version": "2.7.0", "build": "OSS"}
+        assert result == _EXP_2_7_OSS
         mock_session.get.assert_called_once()
 
-    def test_no_influxdb_headers_returns_failure(self):
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.headers = {}
-        mock_session.get.return_value = mock_response
+    def test_no_influxdb_headers_returns_failure(self, import_syms, mock_session_factory):
+        mock_session, _ = mock_session_factory(headers={})
 
-        result = check_source_connection(
+        result = import_syms.check_source_connection(
             {"source_url": "http://localhost:8086"},
             session=mock_session,
         )
 
-        assert result == {"success": False, "message": "Not an InfluxDB instance"}
+        assert result == _EXP_NOT_INFLUX
 
-    def test_only_version_header_returns_success(self):
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.headers = {"X-Influxdb-Version": "1.8.10"}
-        mock_session.get.return_value = mock_response
+    def test_only_version_header_returns_success(self, import_syms, mock_session_factory):
+        mock_session, _ = mock_session_factory(headers={"X-Influxdb-Version": "1.8.10"})
 
-        result = check_source_connection(
+        result = import_syms.check_source_connection(
             {"source_url": "http://localhost:8086"},
             session=mock_session,
         )
 
         assert result == {"success": True, "version": "1.8.10", "build": ""}
 
-    def test_only_build_header_returns_success(self):
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.headers = {"X-Influxdb-Build": "Enterprise"}
-        mock_session.get.return_value = mock_response
+    def test_only_build_header_returns_success(self, import_syms, mock_session_factory):
+        mock_session, _ = mock_session_factory(headers={"X-Influxdb-Build": "Enterprise"})
 
-        result = check_source_connection(
+        result = import_syms.check_source_connection(
             {"source_url": "http://localhost:8086"},
             session=mock_session,
         )
 
         assert result == {"success": True, "version": "", "build": "Enterprise"}
 
-    def test_request_exception_returns_failure_with_raw_message(self):
-        import requests
-
-        mock_session = Mock()
-        mock_session.get.side_effect = requests.exceptions.ConnectionError(
+    def test_request_exception_returns_failure_with_raw_message(self, import_syms, mock_session_factory):
+        mock_session, _ = mock_session_factory(side_effect=RequestsConnectionError(
             "HTTPConnectionPool(host='localhost', port=8086): Max retries exceeded"
-        )
+        ))
 
-        result = check_source_connection(
+        result = import_syms.check_source_connection(
             {"source_url": "http://localhost:8086"},
             session=mock_session,
         )
@@ -148,13 +104,10 @@ class TestCheckSourceConnection:
         assert result["success"] is False
         assert "Max retries exceeded" in result["message"]
 
-    def test_timeout_returns_failure_with_raw_message(self):
-        import requests
-
-        mock_session = Mock()
-        mock_session.get.side_effect = requests.exceptions.Timeout("Read timed out")
+    def test_timeout_returns_failure_with_raw_message(self, import_syms, mock_session_factory):
+        mock_session, _ = mock_session_factory(side_effect=Timeout("Read timed out"))
 
-        result = check_source_connection(
+        result = import_syms.check_source_connection(
             {"source_url": "http://localhost:8086"},
             session=mock_session,
         )
@@ -162,18 +115,15 @@ class TestCheckSourceConnection:
         assert result["success"] is False
         assert "timed out" in result["message"]
 
-    def test_missing_source_url_returns_validation_error(self):
-        result = check_source_connection({})
+    def test_missing_source_url_returns_validation_error(self, import_syms):
+        result = import_syms.check_source_connection({})
 
-        assert result == {"success": False, "message": "source_url is required"}
+        assert result == _EXP_MISSING_URL
 
-    def test_port_inferred_from_http_scheme(self):
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.headers = {"X-Influxdb-Version": "2.0.0", "X-Influxdb-Build": "OSS"}
-        mock_session.get.return_value = mock_response
+    def test_port_inferred_from_http_scheme(self, import_syms, mock_session_factory):
+        mock_session, _ = mock_session_factory(headers={"X-Influxdb-Version": "2.0.0", "X-Influxdb-Build": "OSS"})
 
-        check_source_connection(
+        import_syms.check_source_connection(
             {"source_url": "http://localhost"},
             session=mock_session,
         )
@@ -181,13 +131,10 @@ class TestCheckSourceConnection:
         call_url = mock_session.get.call_args[0][0]
         assert call_url == "http://localhost:80/ping"
 
-    def test_port_inferred_from_https_scheme(self):
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.headers = {"X-Influxdb-Version": "2.0.0", "X-Influxdb-Build": "OSS"}
-        mock_session.get.return_value = mock_response
+    def test_port_inferred_from_https_scheme(self, import_syms, mock_session_factory):
+        mock_session, _ = mock_session_factory(headers={"X-Influxdb-Version": "2.0.0", "X-Influxdb-Build": "OSS"})
 
-        check_source_connection(
+        import_syms.check_source_connection(
             {"source_url": "https://myserver.com"},
             session=mock_session,
         )
@@ -195,208 +142,175 @@ class TestCheckSourceConnection:
         call_url = mock_session.get.call_args[0][0]
         assert call_url == "https://myserver.com:443/ping"
 
-    def test_cluster_uuid_header_detects_v3(self):
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.headers = {"cluster-uuid": "8a66b257-af97-41c1-a3a8-3c04b7451ebd"}
-        mock_session.get.return_value = mock_response
+    def test_cluster_uuid_header_detects_v3(self, import_syms, mock_session_factory):
+        mock_session, _ = mock_session_factory(headers={"cluster-uuid": "8a66b257-af97-41c1-a3a8-3c04b7451ebd"})
 
-        result = check_source_connection(
+        result = import_syms.check_source_connection(
             {"source_url": "http://localhost:8086"},
             session=mock_session,
         )
 
         assert result == {"success": True, "version": "3.x.x", "build": ""}
 
-    def test_version_headers_take_precedence_over_cluster_uuid(self):
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.headers = {
+    def test_version_headers_take_precedence_over_cluster_uuid(self, import_syms, mock_session_factory):
+        mock_session, _ = mock_session_factory(headers={
             "X-Influxdb-Version": "2.7.0",
             "X-Influxdb-Build": "OSS",
             "cluster-uuid": "8a66b257-af97-41c1-a3a8-3c04b7451ebd",
-        }
-        mock_session.get.return_value = mock_response
+        })
 
-        result = check_source_connection(
+        result = import_syms.check_source_connection(
             {"source_url": "http://localhost:8086"},
             session=mock_session,
         )
 
-        assert result == {"success": True, "version": "2.7.0", "build": "OSS"}
+        assert result == _EXP_2_7_OSS
 
-    def test_401_without_headers_returns_unable_to_determine(self):
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.headers = {}
-        mock_response.status_code = 401
-        mock_session.get.return_value = mock_response
+    def test_401_without_headers_returns_unable_to_determine(self, import_syms, mock_session_factory):
+        mock_session, _ = mock_session_factory(headers={}, status_code=401)
 
-        result = check_source_connection(
+        result = import_syms.check_source_connection(
             {"source_url": "http://localhost:8086"},
             session=mock_session,
         )
 
-        assert result == {"success": False, "message": "Unable to determine InfluxDB version"}
+        assert result == _EXP_UNDETERMINED
 
-    def test_403_without_headers_returns_unable_to_determine(self):
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.headers = {}
-        mock_response.status_code = 403
-        mock_session.get.return_value = mock_response
+    def test_403_without_headers_returns_unable_to_determine(self, import_syms, mock_session_factory):
+        mock_session, _ = mock_session_factory(headers={}, status_code=403)
 
-        result = check_source_connection(
+        result = import_syms.check_source_connection(
             {"source_url": "http://localhost:8086"},
             session=mock_session,
         )
 
-        assert result == {"success": False, "message": "Unable to determine InfluxDB version"}
+        assert result == _EXP_UNDETERMINED
 
-    def test_401_with_version_headers_returns_success(self):
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.headers = {"X-Influxdb-Version": "2.7.0", "X-Influxdb-Build": "OSS"}
-        mock_response.status_code = 401
-        mock_session.get.return_value = mock_response
+    def test_401_with_version_headers_returns_success(self, import_syms, mock_session_factory):
+        mock_session, _ = mock_session_factory(headers={"X-Influxdb-Version": "2.7.0", "X-Influxdb-Build": "OSS"}, status_code=401)
 
-        result = check_source_connection(
+        result = import_syms.check_source_connection(
             {"source_url": "http://localhost:8086"},
             session=mock_session,
         )
 
-        assert result == {"success": True, "version": "2.7.0", "build": "OSS"}
+        assert result == _EXP_2_7_OSS
 
 
 class TestBuildV3Headers:
     """Tests for _build_v3_headers."""
 
-    def test_with_token(self):
-        credentials = {"source_token": "my-token", "source_username": None, "source_password": None}
-        headers = _build_v3_headers(credentials)
-        assert headers == {
-            "Content-Type": "application/json",
-            "Authorization": "Bearer my-token",
-        }
-
-    def test_without_token(self):
-        credentials = {"source_token": None, "source_username": None, "source_password": None}
-        headers = _build_v3_headers(credentials)
-        assert headers == {"Content-Type": "application/json"}
+    @pytest.mark.parametrize("token,expected", [
+        ("my-token", {"Content-Type": "application/json", "Authorization": "Bearer my-token"}),
+        (None, {"Content-Type": "application/json"}),
+    ])
+    def test_build(self, token, expected, import_syms):
+        credentials = {"source_token": token, "source_username": None, "source_password": None}
+        assert import_syms._build_v3_headers(credentials) == expected
 
 
 class TestParseV3Databases:
     """Tests for _parse_v3_databases."""
 
-    def test_extracts_database_names(self):
-        result = _parse_v3_databases([
-            {"iox::database": "_internal"},
-            {"iox::database": "import"},
-            {"iox::database": "test"},
-        ])
-        assert result == ["import", "test"]
-
-    def test_filters_internal_database(self):
-        result = _parse_v3_databases([
-            {"iox::database": "_internal"},
-            {"iox::database": "mydb"},
-        ])
-        assert "_internal" not in result
-        assert result == ["mydb"]
-
-    def test_empty_response_returns_empty_list(self):
-        result = _parse_v3_databases([])
-        assert result == []
+    @pytest.mark.parametrize("rows,expected", [
+        (
+            [{"iox::database": "_internal"}, {"iox::database": "import"}, {"iox::database": "test"}],
+            ["import", "test"],
+        ),
+        ([{"iox::database": "_internal"}, {"iox::database": "mydb"}], ["mydb"]),
+        ([], []),
+    ])
+    def test_parse(self, rows, expected, import_syms):
+        assert import_syms._parse_v3_databases(rows) == expected
 
 
 class TestParseV3Tables:
     """Tests for _parse_v3_tables."""
 
-    def test_extracts_iox_schema_tables(self):
-        result = _parse_v3_tables([
-            {"table_catalog": "public", "table_schema": "iox", "table_name": "import_pause_state", "table_type": "BASE TABLE"},
-            {"table_catalog": "public", "table_schema": "system", "table_name": "compacted_data", "table_type": "BASE TABLE"},
-            {"table_catalog": "public", "table_schema": "information_schema", "table_name": "tables", "table_type": "VIEW"},
-        ])
-        assert result == ["import_pause_state"]
-
-    def test_filters_system_schema(self):
-        result = _parse_v3_tables([
-            {"table_catalog": "public", "table_schema": "system", "table_name": "queries", "table_type": "BASE TABLE"},
-        ])
-        assert result == []
-
-    def test_filters_information_schema(self):
-        result = _parse_v3_tables([
-            {"table_catalog": "public", "table_schema": "information_schema", "table_name": "columns", "table_type": "VIEW"},
-        ])
-        assert result == []
-
-    def test_empty_response_returns_empty_list(self):
-        result = _parse_v3_tables([])
-        assert result == []
+    @pytest.mark.parametrize("rows,expected", [
+        (
+            [
+                {"table_catalog": "public", "table_schema": "iox", "table_name": "import_pause_state", "table_type": "BASE TABLE"},
+                {"table_catalog": "public", "table_schema": "system", "table_name": "compacted_data", "table_type": "BASE TABLE"},
+                {"table_catalog": "public", "table_schema": "information_schema", "table_name": "tables", "table_type": "VIEW"},
+            ],
+            ["import_pause_state"],
+        ),
+        ([{"table_catalog": "public", "table_schema": "system", "table_name": "queries", "table_type": "BASE TABLE"}], []),
+        ([{"table_catalog": "public", "table_schema": "information_schema", "table_name": "columns", "table_type": "VIEW"}], []),
+        ([], []),
+    ])
+    def test_parse(self, rows, expected, import_syms):
+        assert import_syms._parse_v3_tables(rows) == expected
 
 
 class TestValidateSourceParams:
     """Tests for _validate_source_params."""
 
-    def test_version_3_is_valid(self):
-        result = _validate_source_params({
-            "source_url": "http://localhost:8086",
-            "influxdb_version": 3,
-        })
-        assert result is None
-
-    def test_version_0_is_invalid(self):
-        result = _validate_source_params({
-            "source_url": "http://localhost:8086",
-            "influxdb_version": 0,
-        })
-        assert result == {"error": "Unsupported influxdb_version: 0. Must be 1, 2, or 3."}
-
-    def test_version_4_is_invalid(self):
-        result = _validate_source_params({
-            "source_url": "http://localhost:8086",
-            "influxdb_version": 4,
-        })
-        assert result == {"error": "Unsupported influxdb_version: 4. Must be 1, 2, or 3."}
-
-    def test_non_numeric_string_version_is_invalid(self):
-        result = _validate_source_params({
+    @pytest.mark.parametrize("version,expected", [
+        (3, None),
+        (0, {"error": "Unsupported influxdb_version: 0. Must be 1, 2, or 3."}),
+        (4, {"error": "Unsupported influxdb_version: 4. Must be 1, 2, or 3."}),
+        ("abc", {"error": "Unsupported influxdb_version: abc. Must be 1, 2, or 3."}),
+    ])
+    def test_validate(self, version, expected, import_syms):
+        result = import_syms._validate_source_params({
             "source_url": "http://localhost:8086",
-            "influxdb_version": "abc",
+            "influxdb_version": version,
         })
-        assert result == {"error": "Unsupported influxdb_version: abc. Must be 1, 2, or 3."}
+        assert result == expected
 
-    def test_numeric_string_version_is_coerced_to_int(self):
+    def test_numeric_string_version_is_coerced_to_int(self, import_syms):
         """Numeric strings like '3' should be accepted and coerced to int."""
         body_data = {
             "source_url": "http://localhost:8086",
             "influxdb_version": "3",
         }
-        result = _validate_source_params(body_data)
+        result = import_syms._validate_source_params(body_data)
         assert result is None  # Valid
         assert body_data["influxdb_version"] == 3  # Coerced to int
 
 
-class TestGetSourceDatabasesListV3:
-    """Tests for get_source_databases_list v3 support."""
-
-    def test_v3_returns_databases_filtering_internal(self):
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {"iox::database": "_internal"},
-            {"iox::database": "import"},
-            {"iox::database": "test"},
-        ]
-        mock_response.raise_for_status = Mock()
-        mock_session.get.return_value = mock_response
-
-        result = get_source_databases_list(
+class TestSourceListingV3:
+    """Tests for get_source_databases_list and get_source_tables_list v3 support."""
+
+    @pytest.mark.parametrize("func_name,extra_params,json_payload,expected_result,expected_url_frag,expected_params", [
+        (
+            "get_source_databases_list",
+            {},
+            [
+                {"iox::database": "_internal"},
+                {"iox::database": "import"},
+                {"iox::database": "test"},
+            ],
+            {"databases": ["import", "test"]},
+            "/api/v3/configure/database",
+            {"format": "json"},
+        ),
+        (
+            "get_source_tables_list",
+            {"source_database": "mydb"},
+            [
+                {"table_catalog": "public", "table_schema": "iox", "table_name": "import_pause_state", "table_type": "BASE TABLE"},
+                {"table_catalog": "public", "table_schema": "system", "table_name": "compacted_data", "table_type": "BASE TABLE"},
+                {"table_catalog": "public", "table_schema": "information_schema", "table_name": "tables", "table_type": "VIEW"},
+            ],
+            {"tables": ["import_pause_state"]},
+            "/api/v3/query_sql",
+            {"db": "mydb", "q": "SHOW TABLES", "format": "json"},
+        ),
+    ])
+    def test_v3_listing_filters_internal_entries(
+        self, func_name, extra_params, json_payload, expected_result, expected_url_frag, expected_params,
+        import_syms, mock_session_factory,
+    ):
+        mock_session, _ = mock_session_factory(json_data=json_payload)
+
+        result = getattr(import_syms, func_name)(
             {
                 "source_url": "http://localhost:8086",
                 "influxdb_version": 3,
+                **extra_params,
             },
             credentials={
                 "source_token": "my-token",
@@ -406,22 +320,20 @@ class TestGetSourceDatabasesListV3:
             session=mock_session,
         )
 
-        assert result == {"databases": ["import", "test"]}
+        assert result == expected_result
         mock_session.get.assert_called_once()
         call_args = mock_session.get.call_args
-        assert "/api/v3/configure/database" in call_args[0][0]
-        assert call_args[1]["params"] == {"format": "json"}
+        assert expected_url_frag in call_args[0][0]
+        assert call_args[1]["params"] == expected_params
 
 
 class TestGetSourceDatabasesListV2:
     """Tests for get_source_databases_list v2 support using InfluxQL."""
 
-    def test_v2_returns_databases_using_influxql_endpoint(self):
+    def test_v2_returns_databases_using_influxql_endpoint(self, import_syms, mock_session_factory):
         """Test that v2 uses /query endpoint with SHOW DATABASES, not /api/v2/buckets."""
-        mock_session = Mock()
-        mock_response = Mock()
         # InfluxQL response format (same as v1)
-        mock_response.json.return_value = {
+        mock_session, _ = mock_session_factory(json_data={
             "results": [
                 {
                     "series": [
@@ -433,11 +345,9 @@ class TestGetSourceDatabasesListV2:
                     ]
                 }
             ]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_session.get.return_value = mock_response
+        })
 
-        result = get_source_databases_list(
+        result = import_syms.get_source_databases_list(
             {
                 "source_url": "http://localhost:8086",
                 "influxdb_version": 2,
@@ -459,15 +369,11 @@ class TestGetSourceDatabasesListV2:
         assert "/api/v2/buckets" not in call_args[0][0]
         assert call_args[1]["params"] == {"q": "SHOW DATABASES"}
 
-    def test_v2_uses_token_auth_header(self):
+    def test_v2_uses_token_auth_header(self, import_syms, mock_session_factory):
         """Test that v2 uses Token authorization header."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {"results": [{}]}
-        mock_response.raise_for_status = Mock()
-        mock_session.get.return_value = mock_response
+        mock_session, _ = mock_session_factory(json_data={"results": [{}]})
 
-        get_source_databases_list(
+        import_syms.get_source_databases_list(
             {
                 "source_url": "http://localhost:8086",
                 "influxdb_version": 2,
@@ -485,50 +391,13 @@ class TestGetSourceDatabasesListV2:
         assert headers.get("Authorization") == "Token my-secret-token"
 
 
-class TestGetSourceTablesListV3:
-    """Tests for get_source_tables_list v3 support."""
-
-    def test_v3_returns_tables_filtering_system_schemas(self):
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {"table_catalog": "public", "table_schema": "iox", "table_name": "import_pause_state", "table_type": "BASE TABLE"},
-            {"table_catalog": "public", "table_schema": "system", "table_name": "compacted_data", "table_type": "BASE TABLE"},
-            {"table_catalog": "public", "table_schema": "information_schema", "table_name": "tables", "table_type": "VIEW"},
-        ]
-        mock_response.raise_for_status = Mock()
-        mock_session.get.return_value = mock_response
-
-        result = get_source_tables_list(
-            {
-                "source_url": "http://localhost:8086",
-                "influxdb_version": 3,
-                "source_database": "mydb",
-            },
-            credentials={
-                "source_token": "my-token",
-                "source_username": None,
-                "source_password": None,
-            },
-            session=mock_session,
-        )
-
-        assert result == {"tables": ["import_pause_state"]}
-        mock_session.get.assert_called_once()
-        call_args = mock_session.get.call_args
-        assert "/api/v3/query_sql" in call_args[0][0]
-        assert call_args[1]["params"] == {"db": "mydb", "q": "SHOW TABLES", "format": "json"}
-
-
 class TestGetSourceTablesListV2:
     """Tests for get_source_tables_list v2 support using InfluxQL."""
 
-    def test_v2_returns_tables_using_influxql_endpoint(self):
+    def test_v2_returns_tables_using_influxql_endpoint(self, import_syms, mock_session_factory):
         """Test that v2 uses /query endpoint with SHOW MEASUREMENTS, not Flux API."""
-        mock_session = Mock()
-        mock_response = Mock()
         # InfluxQL response format (same as v1)
-        mock_response.json.return_value = {
+        mock_session, _ = mock_session_factory(json_data={
             "results": [
                 {
                     "series": [
@@ -540,11 +409,9 @@ class TestGetSourceTablesListV2:
                     ]
                 }
             ]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_session.get.return_value = mock_response
+        })
 
-        result = get_source_tables_list(
+        result = import_syms.get_source_tables_list(
             {
                 "source_url": "http://localhost:8086",
                 "influxdb_version": 2,
@@ -567,16 +434,12 @@ class TestGetSourceTablesListV2:
         assert "/api/v2/query" not in call_args[0][0]
         assert call_args[1]["params"] == {"db": "mybucket", "q": "SHOW MEASUREMENTS"}
 
-    def test_v2_does_not_require_org(self):
+    def test_v2_does_not_require_org(self, import_syms, mock_session_factory):
         """Test that v2 works without source_org parameter."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {"results": [{"series": [{"values": [["test"]]}]}]}
-        mock_response.raise_for_status = Mock()
-        mock_session.get.return_value = mock_response
+        mock_session, _ = mock_session_factory(json_data={"results": [{"series": [{"values": [["test"]]}]}]})
 
         # Should not return an error about missing org
-        result = get_source_tables_list(
+        result = import_syms.get_source_tables_list(
             {
                 "source_url": "http://localhost:8086",
                 "influxdb_version": 2,
@@ -593,15 +456,11 @@ class TestGetSourceTablesListV2:
         assert "error" not in result
         assert "tables" in result
 
-    def test_v2_uses_token_auth_header(self):
+    def test_v2_uses_token_auth_header(self, import_syms, mock_session_factory):
         """Test that v2 uses Token authorization header."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {"results": [{}]}
-        mock_response.raise_for_status = Mock()
-        mock_session.get.return_value = mock_response
+        mock_session, _ = mock_session_factory(json_data={"results": [{}]})
 
-        get_source_tables_list(
+        import_syms.get_source_tables_list(
             {
                 "source_url": "http://localhost:8086",
                 "influxdb_version": 2,
@@ -620,71 +479,113 @@ class TestGetSourceTablesListV2:
         assert headers.get("Authorization") == "Token my-secret-token"
 
 
+class TestDiscoverSource:
+    """Tests for discover_source."""
+
+    @staticmethod
+    def _v1_session(mock_session_factory):
+        def get(url, **kwargs):
+            if url.endswith("/ping"):
+                return SimpleNamespace(
+                    headers={"X-Influxdb-Version": "1.8.10", "X-Influxdb-Build": "OSS"},
+                    status_code=204,
+                )
+            if kwargs["params"]["q"] == "SHOW DATABASES":
+                values = [["_internal"], ["telegraf"]]
+            else:
+                values = [["mem"], ["cpu"]]
+            return SimpleNamespace(
+                content=json.dumps({"results": [{"series": [{"values": values}]}]}).encode(),
+                raise_for_status=lambda: None,
+            )
+
+        mock_session, _ = mock_session_factory(side_effect=get)
+        return mock_session
+
+    def test_combines_connection_databases_and_tables(self, import_syms, mock_session_factory):
+        mock_session = self._v1_session(mock_session_factory)
+
+        result = import_syms.discover_source(
+            {
+                "source_url": "http://localhost:8086",
+                "influxdb_version": "1",
+                "source_database": "telegraf",
+            },
+            credentials={"source_token": "my-token"},
+            session=mock_session,
+        )
+
+        assert result == {
+            "connection": {"success": True, "version": "1.8.10", "build": "OSS"},
+            "databases": {"databases": ["telegraf"]},
+            "tables": {"tables": ["cpu", "mem"]},
+        }
+        assert mock_session.get.call_count == 3
+
+    def test_skips_tables_without_source_database(self, import_syms, mock_session_factory):
+        mock_session = self._v1_session(mock_session_factory)
+
+        result = import_syms.discover_source(
+            {"source_url": "http://localhost:8086", "influxdb_version": 1},
+            credentials={"source_token": "my-token"},
+            session=mock_session,
+        )
+
+        assert result["databases"] == {"databases": ["telegraf"]}
+        assert result["tables"] is None
+        assert mock_session.get.call_count == 2
+
+
+@pytest.fixture(scope="module")
+def v3_config(import_syms):
+    # Config carries no credential fields; tokens are passed separately
+    return import_syms.ImportConfig(
+        source_url="http://localhost",
+        source_database="mydb",
+        influxdb_version=3,
+    )
+
+
+@pytest.fixture
+def v3_credentials():
+    return {
+        "source_token": "my-v3-token",
+        "source_username": None,
+        "source_password": None,
+    }
+
+
+@pytest.fixture
+def mock_influxdb3_local():
+    return Mock(spec_set=["info", "warn", "error", "query", "write_sync", "write_sync_to_db"])
+
+
 class TestQuerySourceInfluxdbV3Auth:
     """Tests for query_source_influxdb v3 authentication."""
 
-    @patch("import.get_http_session")
-    def test_v3_uses_bearer_token_auth(self, mock_get_session):
+    def test_v3_uses_bearer_token_auth(
+        self, monkeypatch, import_mod, import_syms, mock_session_factory, mock_influxdb3_local, v3_config, v3_credentials
+    ):
         """Verify v3 uses Bearer token in Authorization header."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {"results": [{"series": []}]}
-        mock_response.raise_for_status = Mock()
-        mock_session.get.return_value = mock_response
-        mock_get_session.return_value = mock_session
-
-        mock_influxdb3_local = Mock()
-
-        # Create config WITHOUT credential fields
-        config = ImportConfig(
-            source_url="http://localhost",
-            source_database="mydb",
-            influxdb_version=3,
-        )
-
-        # Create credentials separately
-        credentials = {
-            "source_token": "my-v3-token",
-            "source_username": None,
-            "source_password": None,
-        }
+        mock_session, _ = mock_session_factory(json_data={"results": [{"series": []}]})
+        monkeypatch.setattr(import_mod, "get_http_session", lambda: mock_session)
 
-        # Pass credentials to function
-        query_source_influxdb(mock_influxdb3_local, config, credentials, "SHOW MEASUREMENTS", "test-task")
+        import_syms.query_source_influxdb(mock_influxdb3_local, v3_config, v3_credentials, "SHOW MEASUREMENTS", "test-task")
 
         # Verify the Authorization header uses Bearer format
         call_kwargs = mock_session.get.call_args
         headers = call_kwargs.kwargs.get("headers", call_kwargs[1].get("headers", {}))
         assert headers.get("Authorization") == "Bearer my-v3-token"
 
-    @patch("import.get_http_session")
-    def test_v3_without_token_no_auth_header(self, mock_get_session):
+    def test_v3_without_token_no_auth_header(
+        self, monkeypatch, import_mod, import_syms, mock_session_factory, mock_influxdb3_local, v3_config, v3_credentials
+    ):
         """Verify v3 without token results in no Authorization header."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {"results": [{"series": []}]}
-        mock_response.raise_for_status = Mock()
-        mock_session.get.return_value = mock_response
-        mock_get_session.return_value = mock_session
-
-        mock_influxdb3_local = Mock()
-
-        # Create config WITHOUT credential fields
-        config = ImportConfig(
-            source_url="http://localhost",
-            source_database="mydb",
-            influxdb_version=3,
-        )
-
-        # Create credentials with no token
-        credentials = {
-            "source_token": None,
-            "source_username": None,
-            "source_password": None,
-        }
+        mock_session, _ = mock_session_factory(json_data={"results": [{"series": []}]})
+        monkeypatch.setattr(import_mod, "get_http_session", lambda: mock_session)
 
-        # Pass credentials to function
-        query_source_influxdb(mock_influxdb3_local, config, credentials, "SHOW MEASUREMENTS", "test-task")
+        credentials = {**v3_credentials, "source_token": None}
+        import_syms.query_source_influxdb(mock_influxdb3_local, v3_config, credentials, "SHOW MEASUREMENTS", "test-task")
 
         # Verify no Authorization header is present
         call_kwargs = mock_session.get.call_args
@@ -695,50 +596,46 @@ class TestQuerySourceInfluxdbV3Auth:
 class TestExtractCredentials:
     """Tests for extract_credentials function"""
 
-    def test_extracts_token_from_headers(self):
-        extract_credentials = import_module.extract_credentials
+    def test_extracts_token_from_headers(self, import_syms):
         # InfluxDB3 normalizes headers to lowercase
         headers = {"source-token": "my-secret-token"}
-        result = extract_credentials(headers)
+        result = import_syms.extract_credentials(headers)
         assert result == {
             "source_token": "my-secret-token",
             "source_username": None,
             "source_password": None,
         }
 
-    def test_extracts_username_password_from_headers(self):
-        extract_credentials = import_module.extract_credentials
+    def test_extracts_username_password_from_headers(self, import_syms):
         # InfluxDB3 normalizes headers to lowercase
         headers = {
             "source-username": "admin",
             "source-password": "secret123",
         }
-        result = extract_credentials(headers)
+        result = import_syms.extract_credentials(headers)
         assert result == {
             "source_token": None,
             "source_username": "admin",
             "source_password": "secret123",
         }
 
-    def test_returns_none_for_missing_headers(self):
-        extract_credentials = import_module.extract_credentials
+    def test_returns_none_for_missing_headers(self, import_syms):
         headers = {}
-        result = extract_credentials(headers)
+        result = import_syms.extract_credentials(headers)
         assert result == {
             "source_token": None,
             "source_username": None,
             "source_password": None,
         }
 
-    def test_extracts_all_credentials_when_present(self):
-        extract_credentials = import_module.extract_credentials
+    def test_extracts_all_credentials_when_present(self, import_syms):
         # InfluxDB3 normalizes headers to lowercase
         headers = {
             "source-token": "token",
             "source-username": "user",
             "source-password": "pass",
         }
-        result = extract_credentials(headers)
+        result = import_syms.extract_credentials(headers)
         assert result == {
             "source_token": "token",
             "source_username": "user",
@@ -66,12 +66,17 @@ import os
 import time
 import tomllib
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from importlib.metadata import version
+from operator import itemgetter
 from pathlib import Path
 
-import pandas as pd
 import pyarrow as pa
-from pyiceberg.catalog import load_catalog
+import pyarrow.parquet as pq
+from pyiceberg.catalog import Catalog, load_catalog
+from pyiceberg.exceptions import NoSuchTableError
 from pyiceberg.schema import Schema
 from pyiceberg.table import Table
 from pyiceberg.types import (
@@ -84,6 +89,59 @@ from pyiceberg.types import (
     TimestampType,
 )
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
+
+# Duration suffixes and their timedelta arguments, longest suffix first
+_DURATION_UNITS: tuple[tuple[str, str], ...] = (
+    ("min", "minutes"),
+    ("s", "seconds"),
+    ("h", "hours"),
+    ("d", "days"),
+    ("w", "weeks"),
+)
+
+# Smallest window a backfill batch is split down to when windows return too many rows
+MIN_BATCH_SIZE: timedelta = timedelta(seconds=1)
+
+# Maximum number of rows converted into a single Arrow record batch
+RECORD_BATCH_ROWS: int = 65536
+
+# Select expression returning 'time' as integer microseconds, the precision of Iceberg timestamps
+TIME_COLUMN_SQL: str = 'CAST("time" AS BIGINT) / 1000 AS "time"'
+
+# information_schema data type of tag columns; every other column is a field
+TAG_DATA_TYPE: str = "Dictionary(Int32, Utf8)"
+_COLUMN_NAME_AND_TYPE = itemgetter("column_name", "data_type")
+
+# Decoded catalog_configs keyed by their base64 trigger argument
+_CATALOG_CONFIG_CACHE: dict[str, dict] = {}
+
+# Parsed TOML config files keyed by path, with the st_mtime_ns they were read at
+_CONFIG_FILE_CACHE: dict[str, tuple[int, dict]] = {}
+
+# Tables used by scheduled runs, keyed by (catalog key, full table name), with
+# their Arrow schema and the Iceberg schema id it was built from
+_TABLE_CACHE: dict[tuple[str, str], tuple[Table, pa.Schema, int]] = {}
+
+# pyiceberg 0.12 and later can append straight from a RecordBatchReader
+try:
+    _APPEND_ACCEPTS_READER: bool = tuple(
+        int(part) for part in version("pyiceberg").split(".")[:2]
+    ) >= (0, 12)
+except Exception:  # unknown or unparsable version; append Arrow tables
+    _APPEND_ACCEPTS_READER = False
+
+
+@lru_cache(maxsize=8)
+def _get_catalog(catalog_key: str) -> Catalog:
+    """Loads the Iceberg catalog for a JSON-encoded configuration, once per configuration."""
+    return load_catalog("iceberg", **json.loads(catalog_key))
+
 
 def get_all_measurements(influxdb3_local) -> list[str]:
     """
@@ -113,28 +171,43 @@ def parse_time_duration(raw: str, task_id: str) -> timedelta:
         timedelta.
 
     Raises:
-        Exception: if format is invalid or number conversion fails.
-    """
-    units: dict = {
-        "s": "seconds",
-        "min": "minutes",
-        "h": "hours",
-        "d": "days",
-        "w": "weeks",
-    }
-    num_part, unit_part = "", ""
-    for u in sorted(units.keys(), key=len, reverse=True):
-        if raw.endswith(u):
-            num_part = raw[: -len(u)]
-            unit_part = u
+        ValueError: if format is invalid or number conversion fails.
+    """
+    for suffix, unit in _DURATION_UNITS:
+        if raw.endswith(suffix):
+            num_part: str = raw.removesuffix(suffix)
             break
-    if not num_part or unit_part not in units:
-        raise Exception(f"[{task_id}] Invalid duration '{raw}'")
+    else:
+        raise ValueError(f"[{task_id}] Invalid duration '{raw}'")
+    if not num_part:
+        raise ValueError(f"[{task_id}] Invalid duration '{raw}'")
     try:
         val: int = int(num_part)
     except ValueError:
-        raise Exception(f"[{task_id}] Invalid number in duration '{raw}'")
-    return timedelta(**{units[unit_part]: val})
+        raise ValueError(f"[{task_id}] Invalid number in duration '{raw}'")
+    return timedelta(**{unit: val})
+
+
+def load_config_file(file_path: Path) -> dict:
+    """
+    Reads a TOML config file, reusing the parsed content while the file is unchanged.
+
+    Args:
+        file_path: path to the .toml file
+
+    Returns:
+        dict: a copy of the parsed config with "use_config_file" set to True
+    """
+    key: str = str(file_path)
+    mtime_ns: int = file_path.stat().st_mtime_ns
+    cached: tuple[int, dict] | None = _CONFIG_FILE_CACHE.get(key)
+    if cached is None or cached[0] != mtime_ns:
+        with open(file_path, "rb") as f:
+            config: dict = tomllib.load(f)
+        config["use_config_file"] = True
+        cached = (mtime_ns, config)
+        _CONFIG_FILE_CACHE[key] = cached
+    return dict(cached[1])
 
 
 def parse_fields(args: dict, key: str, task_id: str) -> list[str]:
@@ -164,6 +237,10 @@ def parse_catalog_configs(args: dict, task_id: str) -> dict:
                 f"[{task_id}] catalog_configs must be a dict when using config file"
             )
 
+    # Trigger arguments rarely change between runs, so reuse the decoded configuration
+    if (cached := _CATALOG_CONFIG_CACHE.get(input_params)) is not None:
+        return cached
+
     try:
         # Decode base64-encoded string
         decoded_bytes: bytes = base64.b64decode(input_params)
@@ -175,18 +252,21 @@ def parse_catalog_configs(args: dict, task_id: str) -> dict:
 
     try:
         # Parse JSON from decoded string
-        params: dict = json.loads(decoded_str)
+        params: dict = _json_loads(decoded_str)
     except json.JSONDecodeError:
         raise Exception(
             f"[{task_id}] Invalid JSON in decoded catalog_configs: {decoded_str}"
         )
 
+    _CATALOG_CONFIG_CACHE[input_params] = params
     return params
 
 
-def get_tag_names(influxdb3_local, measurement: str, task_id: str) -> list[str]:
+def get_columns(
+    influxdb3_local, measurement: str, task_id: str
+) -> tuple[list[str], list[str]]:
     """
-    Retrieves the list of tag names for a measurement.
+    Retrieves tag and field names for a measurement with a single query.
 
     Args:
         influxdb3_local: InfluxDB client instance.
@@ -194,53 +274,39 @@ def get_tag_names(influxdb3_local, measurement: str, task_id: str) -> list[str]:
         task_id (str): Unique task identifier.
 
     Returns:
-        list[str]: List of tag names with 'Dictionary(Int32, Utf8)' data type.
+        tuple[list[str], list[str]]: Tag names (columns with 'Dictionary(Int32, Utf8)'
+            data type) and field names (all other columns).
     """
     query: str = """
-        SELECT column_name
+        SELECT column_name, data_type
         FROM information_schema.columns
         WHERE table_name = $measurement
-        AND data_type = 'Dictionary(Int32, Utf8)'
     """
     res: list[dict] = influxdb3_local.query(query, {"measurement": measurement})
 
-    if not res:
+    tag_names: list[str] = []
+    field_names: list[str] = []
+    for column_name, data_type in map(_COLUMN_NAME_AND_TYPE, res):
+        if data_type == TAG_DATA_TYPE:
+            tag_names.append(column_name)
+        else:
+            field_names.append(column_name)
+
+    if not tag_names:
         influxdb3_local.info(
             f"[{task_id}] No tags found for measurement '{measurement}'."
         )
-        return []
-
-    tag_names: list[str] = [tag["column_name"] for tag in res]
-    return tag_names
-
-
-def get_fields_names(influxdb3_local, measurement: str, task_id: str) -> list[str]:
-    """
-    Retrieves the list of field names for a measurement.
-
-    Args:
-        influxdb3_local: InfluxDB client instance.
-        measurement (str): Name of the measurement to query.
-        task_id (str): Unique task identifier.
-
-    Returns:
-        list[str]: List of field names.
-    """
-    query = """
-        SELECT column_name
-        FROM information_schema.columns
-        WHERE table_name = $measurement
-        AND data_type != 'Dictionary(Int32, Utf8)'
-    """
-    res: list[dict] = influxdb3_local.query(query, {"measurement": measurement})
-
-    if not res:
+    if not field_names:
         raise Exception(
             f"[{task_id}] No fields found for measurement '{measurement}'."
         )
 
-    field_names: list[str] = [field["column_name"] for field in res]
-    return field_names
+    return tag_names, field_names
+
+
+def quote_identifier(name: str) -> str:
+    """Quotes a table or column name for use in SQL, escaping embedded double quotes."""
+    return '"' + name.replace('"', '""') + '"'
 
 
 def generate_fields_string(tags: list[str], fields: list[str]) -> str:
@@ -253,27 +319,30 @@ def generate_fields_string(tags: list[str], fields: list[str]) -> str:
 
     Returns:
         str: Formatted string with quoted field names separated by commas and newlines.
+            'time' is converted to microseconds by the engine.
     """
     all_fields: list = tags + fields
-    return ",\n\t".join(f'"{field}"' for field in all_fields)
+    return ",\n\t".join(
+        TIME_COLUMN_SQL if field == "time" else quote_identifier(field)
+        for field in all_fields
+    )
 
 
 def generate_query(
     measurement: str,
     tag_names: list[str],
     field_names: list[str],
-    start_time: datetime,
-    end_time: datetime,
 ) -> str:
     """
-    Builds an SQL query.
+    Builds an SQL query for one time window.
+
+    The window bounds are bound as $start and $end query parameters (see
+    window_params), so the same query text is reused for every window.
 
     Args:
         measurement: source measurement name
         tag_names: list of tags
         field_names: list of field names
-        start_time: UTC datetime for WHERE time > ...
-        end_time:   UTC datetime for WHERE time < ...
 
     Returns:
         A complete SQL query string.
@@ -285,125 +354,239 @@ def generate_query(
             SELECT
                 {fields_clause}
             FROM
-                '{measurement}'
+                {quote_identifier(measurement)}
             WHERE
-                time >= '{start_time}'
+                time >= $start
             AND 
-                time < '{end_time}'
+                time < $end
             ORDER BY time
         """
     return query
 
 
-def pandas_dtype_to_iceberg_type(dtype) -> PrimitiveType:
-    """Converts a Pandas dtype to an Iceberg type."""
-    if pd.api.types.is_integer_dtype(dtype):
-        return LongType()
-    elif pd.api.types.is_float_dtype(dtype):
-        return DoubleType()
-    elif pd.api.types.is_bool_dtype(dtype):
-        return BooleanType()
-    elif pd.api.types.is_datetime64_any_dtype(dtype):
-        return TimestampType()
-    elif pd.api.types.is_string_dtype(dtype):
-        return StringType()
-    else:
-        raise TypeError(f"Unsupported dtype: {dtype}")
+def window_params(start_time: datetime, end_time: datetime) -> dict[str, str]:
+    """Returns the $start/$end parameters of a query built by generate_query."""
+    return {"start": start_time.isoformat(), "end": end_time.isoformat()}
+
+
+# Iceberg types for the Arrow types pa.array infers from query values; all-null
+# columns become strings
+_ARROW_TO_ICEBERG: dict[pa.DataType, type[PrimitiveType]] = {
+    pa.int64(): LongType,
+    pa.uint64(): LongType,
+    pa.float64(): DoubleType,
+    pa.bool_(): BooleanType,
+    pa.timestamp("us"): TimestampType,
+    pa.string(): StringType,
+    pa.null(): StringType,
+}
+
+
+def arrow_type_to_iceberg_type(arrow_type: pa.DataType) -> PrimitiveType:
+    """Converts an Arrow type inferred from query values to an Iceberg type."""
+    iceberg_type = _ARROW_TO_ICEBERG.get(arrow_type)
+    if iceberg_type is None:
+        raise TypeError(f"Unsupported Arrow type: {arrow_type}")
+    return iceberg_type()
+
 
+def records_to_iceberg_schema(records: list[dict]) -> Schema:
+    """
+    Generates an Iceberg schema from query records, letting Arrow infer the column types.
+
+    Args:
+        records: rows returned by influxdb3_local.query, with 'time' in microseconds.
 
-def df_to_iceberg_schema(df: pd.DataFrame) -> Schema:
-    """Generates an Iceberg schema from a Pandas DataFrame."""
+    Returns:
+        Schema: one field per column, with 'time' as a timestamp. Columns without
+        null values are marked as required.
+    """
+    column_names: list[str] = list(dict.fromkeys(key for record in records for key in record))
     fields: list = []
-    for idx, (col_name, dtype) in enumerate(df.dtypes.items(), start=1):
-        iceberg_type = pandas_dtype_to_iceberg_type(dtype)
-        required: bool = not df[col_name].isnull().any()
+    for idx, col_name in enumerate(column_names, start=1):
+        values: pa.Array = pa.array([record.get(col_name) for record in records])
+        iceberg_type = (
+            TimestampType() if col_name == "time" else arrow_type_to_iceberg_type(values.type)
+        )
         field: NestedField = NestedField(
-            field_id=idx, name=col_name, field_type=iceberg_type, required=required
+            field_id=idx, name=col_name, field_type=iceberg_type, required=not values.null_count
         )
         fields.append(field)
     return Schema(*fields)
 
 
-def update_schema_and_dataframe(table: Table, df: pd.DataFrame, influxdb3_local, task_id: str) -> tuple[bool, pd.DataFrame]:
+def update_table_schema(table: Table, records: list[dict], influxdb3_local, task_id: str) -> bool:
     """
-    Updates Iceberg table schema and DataFrame to ensure compatibility.
+    Adds columns found in the data but missing from the Iceberg table schema.
+
+    Columns that exist in the schema but not in the data need no handling here:
+    they are written as nulls when the records are converted to Arrow.
 
     Args:
         table: Iceberg table instance
-        df: DataFrame with new data (will be modified in-place)
+        records: rows returned by influxdb3_local.query
         influxdb3_local: InfluxDB client instance for logging
         task_id: Task ID for logging
 
     Returns:
-        tuple: (schema_was_updated: bool, updated_dataframe: pd.DataFrame)
+        bool: True if the table schema was updated. The commit refreshes
+        ``table.metadata``, so callers can read the new schema from the same
+        Table object without reloading it from the catalog.
     """
-    current_schema = table.schema()
-    current_columns = {field.name for field in current_schema.fields}
-    df_columns = set(df.columns)
+    current_columns = {field.name for field in table.schema().fields}
+    record_columns = set().union(*records)
+
+    new_columns = record_columns - current_columns
+    missing_columns = current_columns - record_columns
 
-    new_columns = df_columns - current_columns
-    missing_columns = current_columns - df_columns
+    if missing_columns:
+        influxdb3_local.info(f"[{task_id}] Data missing columns from schema: {missing_columns}. Writing null values.")
 
     # If no schema changes needed
-    if not new_columns and not missing_columns:
-        return False, df
+    if not new_columns:
+        return False
+
+    influxdb3_local.info(f"[{task_id}] Found new columns: {new_columns}. Updating schema.")
+
+    # Create update transaction
+    with table.update_schema() as update:
+        for col_name in new_columns:
+            # Let Arrow infer the column type from its values
+            values: pa.Array = pa.array([record.get(col_name) for record in records])
+            iceberg_type = arrow_type_to_iceberg_type(values.type)
+            # New columns must always be optional (required=False) when adding to existing table
+            # because existing records won't have this field
+            required = False
+
+            update.add_column(
+                col_name,
+                iceberg_type,
+                required=required
+            )
+            influxdb3_local.info(f"[{task_id}] Added column '{col_name}' with type {iceberg_type} (optional)")
 
-    schema_updated = False
-    df_modified = df.copy()
+    influxdb3_local.info(f"[{task_id}] Schema updated successfully")
+    return True
 
-    # Add missing columns to DataFrame with null values
-    if missing_columns:
-        influxdb3_local.info(f"[{task_id}] DataFrame missing columns from schema: {missing_columns}. Adding with null values.")
-
-        for col_name in missing_columns:
-            # Find the field type from current schema
-            field_type = None
-            for field in current_schema.fields:
-                if field.name == col_name:
-                    field_type = field.field_type
-                    break
-
-            # Add column with appropriate null values based on type
-            if isinstance(field_type, LongType):
-                df_modified[col_name] = pd.Series([None] * len(df_modified), dtype='Int64')
-            elif isinstance(field_type, DoubleType):
-                df_modified[col_name] = pd.Series([None] * len(df_modified), dtype='float64')
-            elif isinstance(field_type, BooleanType):
-                df_modified[col_name] = pd.Series([None] * len(df_modified), dtype='boolean')
-            elif isinstance(field_type, TimestampType):
-                df_modified[col_name] = pd.Series([None] * len(df_modified), dtype='datetime64[us]')
-            else:  # StringType or other
-                df_modified[col_name] = pd.Series([None] * len(df_modified), dtype='string')
-
-            influxdb3_local.info(f"[{task_id}] Added missing column '{col_name}' with null values")
-
-    # Add new columns to schema
-    if new_columns:
-        influxdb3_local.info(f"[{task_id}] Found new columns: {new_columns}. Updating schema.")
-
-        # Create update transaction
-        with table.update_schema() as update:
-            for col_name in new_columns:
-                iceberg_type = pandas_dtype_to_iceberg_type(df_modified[col_name].dtype)
-                # New columns must always be optional (required=False) when adding to existing table
-                # because existing records won't have this field
-                required = False
-
-                update.add_column(
-                    col_name,
-                    iceberg_type,
-                    required=required
-                )
-                influxdb3_local.info(f"[{task_id}] Added column '{col_name}' with type {iceberg_type} (optional)")
 
-        schema_updated = True
+def rows_to_arrow(rows: list[dict], schema: pa.Schema) -> pa.RecordBatch:
+    """
+    Builds an Arrow record batch from query rows, one typed array per schema column.
+
+    Args:
+        rows: rows returned by influxdb3_local.query, with 'time' in microseconds.
+        schema: Arrow schema of the target Iceberg table.
+
+    Returns:
+        pa.RecordBatch with the given schema. Columns missing from the rows are null.
+
+    Raises:
+        ValueError: if a required column contains null values.
+    """
+    # Values are fed to Arrow from generators, so no per-column Python list is built
+    num_rows: int = len(rows)
+    arrays: list[pa.Array] = []
+    for field in schema:
+        name: str = field.name
+        if name == "time":
+            # Integer microseconds are stored as-is; only other units need a cast
+            array: pa.Array = pa.array(
+                (row[name] for row in rows),
+                type=pa.timestamp("us", tz=field.type.tz),
+                size=num_rows,
+            )
+            if field.type.unit != "us":
+                array = array.cast(field.type, safe=False)
+        else:
+            array = pa.array(
+                (row.get(name) for row in rows), type=field.type, size=num_rows
+            )
+        if not field.nullable and array.null_count:
+            raise ValueError(
+                f"Column '{name}' is required but has {array.null_count} null values"
+            )
+        arrays.append(array)
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def iter_record_batches(
+    records: list[dict], pa_schema: pa.Schema, batch_rows: int = RECORD_BATCH_ROWS
+) -> pa.RecordBatchReader:
+    """
+    Converts query records to Arrow record batches matching the Iceberg table schema.
+
+    Records are converted slice by slice, so no copy of the whole result is
+    made. Schema columns missing from the records are filled with nulls.
+
+    Args:
+        records: rows returned by influxdb3_local.query, with 'time' in microseconds.
+        pa_schema: Arrow schema of the target Iceberg table.
+        batch_rows: maximum number of rows per record batch.
+
+    Returns:
+        pa.RecordBatchReader yielding batches with pa_schema.
+    """
+    def batches():
+        if len(records) <= batch_rows:
+            # Common case of a single batch: convert without copying the record list
+            yield rows_to_arrow(records, pa_schema)
+            return
+        for offset in range(0, len(records), batch_rows):
+            yield rows_to_arrow(records[offset : offset + batch_rows], pa_schema)
+
+    return pa.RecordBatchReader.from_batches(pa_schema, batches())
+
+
+def refresh_arrow_schema(table: Table, pa_schema: pa.Schema) -> pa.Schema:
+    """
+    Returns the Arrow schema of the table's current Iceberg schema.
+
+    The given pa_schema object is returned unchanged when it is still equal
+    (including field ids), so callers keep a single schema object per table
+    while its columns do not change.
+    """
+    current: pa.Schema = table.schema().as_arrow()
+    return pa_schema if pa_schema.equals(current, check_metadata=True) else current
+
+
+def append_record_batches(table: Table, reader: pa.RecordBatchReader) -> None:
+    """
+    Appends record batches to an Iceberg table as a single snapshot.
+
+    The reader is streamed into pyiceberg when the installed release supports it
+    and the table is unpartitioned; otherwise the batches are gathered into one
+    Arrow table (without copying) first.
+    """
+    if _APPEND_ACCEPTS_READER and table.spec().is_unpartitioned():
+        table.append(reader)
+    else:
+        table.append(reader.read_all())
+
 
-    if schema_updated:
-        influxdb3_local.info(f"[{task_id}] Schema updated successfully")
-    elif missing_columns:
-        influxdb3_local.info(f"[{task_id}] DataFrame adjusted to match existing schema")
+def write_parquet_file(
+    table: Table, pa_schema: pa.Schema, batches: list[pa.RecordBatch]
+) -> str:
+    """
+    Writes record batches into one ZSTD-compressed Parquet file under the table's data location.
 
-    return schema_updated, df_modified
+    The file is written without Iceberg field ids so that it can be registered
+    with Table.add_files, which maps columns by name.
+
+    Args:
+        table: Iceberg table the file will be added to
+        pa_schema: Arrow schema of the table, as returned by Schema.as_arrow()
+        batches: record batches matching pa_schema
+
+    Returns:
+        str: location of the written file
+    """
+    file_schema: pa.Schema = pa.schema([field.remove_metadata() for field in pa_schema])
+    location: str = f"{table.location()}/data/{uuid.uuid4()}.parquet"
+    with table.io.new_output(location).create(overwrite=True) as stream:
+        with pq.ParquetWriter(stream, file_schema, compression="zstd") as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+    return location
 
 
 def process_scheduled_call(
@@ -430,11 +613,11 @@ def process_scheduled_call(
         None. All outcomes and errors are logged via influxdb3_local.
 
     Notes:
-      - If the Iceberg table does not exist, it is created with a schema inferred from the DataFrame.
+      - If the Iceberg table does not exist, it is created with a schema inferred from the Arrow types of the query results.
       - If auto_update_schema=True and schema differs, the table schema is automatically updated.
       - Each append writes a new file in Iceberg (normal behavior).
     """
-    task_id = str(uuid.uuid4())
+    task_id = uuid.uuid4().hex
     influxdb3_local.info(f"[{task_id}] Starting scheduled call with args: {args} and call_time: {call_time}")
 
     # Override args with config file if specified
@@ -475,9 +658,7 @@ def process_scheduled_call(
                         return
                     file_path = resolved
                 influxdb3_local.info(f"[{task_id}] Reading config file {file_path}")
-                with open(file_path, "rb") as f:
-                    args = tomllib.load(f)
-                    args["use_config_file"] = True
+                args = load_config_file(file_path)
                 influxdb3_local.info(f"[{task_id}] New args content: {args}")
             except Exception:
                 influxdb3_local.error(f"[{task_id}] Failed to read config file")
@@ -505,8 +686,8 @@ def process_scheduled_call(
         # Parse config
         window: timedelta = parse_time_duration(args["window"], task_id)
         catalog_configs: dict = parse_catalog_configs(args, task_id)
-        included_fields: list = parse_fields(args, "included_fields", task_id)
-        excluded_fields: list = parse_fields(args, "excluded_fields", task_id)
+        included_fields: frozenset = frozenset(parse_fields(args, "included_fields", task_id))
+        excluded_fields: frozenset = frozenset(parse_fields(args, "excluded_fields", task_id))
         namespace: str = args.get("namespace", "default")
         table_name: str = args.get("table_name", measurement)
         auto_update_schema: bool = str(args.get("auto_update_schema", False)).lower() == "true"
@@ -520,8 +701,7 @@ def process_scheduled_call(
         influxdb3_local.info(f"[{task_id}] Querying data from {start_time} to {end_time}")
 
         # Get data
-        tags: list = get_tag_names(influxdb3_local, measurement, task_id)
-        fields: list = get_fields_names(influxdb3_local, measurement, task_id)
+        tags, fields = get_columns(influxdb3_local, measurement, task_id)
 
         # Filter tags using included_fields/excluded_fields parameters
         if included_fields:
@@ -543,10 +723,10 @@ def process_scheduled_call(
         influxdb3_local.info(f"[{task_id}] Fields to query: {fields_to_query}")
         influxdb3_local.info(f"[{task_id}] Tags to include: {tags}")
 
-        query: str = generate_query(
-            measurement, tags, fields_to_query, start_time, end_time
+        query: str = generate_query(measurement, tags, fields_to_query)
+        results: list = influxdb3_local.query(
+            query, window_params(start_time, end_time)
         )
-        results: list = influxdb3_local.query(query)
         if not results:
             influxdb3_local.info(
                 f"[{task_id}] No data returned from {start_time} to {end_time}"
@@ -554,59 +734,57 @@ def process_scheduled_call(
             return
         influxdb3_local.info(f"[{task_id}] Retrieved {len(results)} records from {measurement}")
 
-        # Convert to DataFrame and convert 'time' to datetime
-        df: pd.DataFrame = pd.DataFrame.from_records(results)
-        try:
-            df["time"] = pd.to_datetime(
-                df["time"], unit="ns"
-            )  # Assuming 'time' column exists and is the timestamp
-            influxdb3_local.info(
-                f"[{task_id}] Successfully converted 'time' column to datetime."
-            )
-        except Exception as e:
-            influxdb3_local.error(
-                f"[{task_id}] Error while converting 'time' to datetime: {e}"
-            )
-            return
-        df["time"] = df["time"].dt.tz_localize(None)
-        df["time"] = df["time"].astype(
-            "datetime64[us]"
-        )  # Ensure time is microsecond datetime for Iceberg
-
         # Load catalog
         influxdb3_local.info(f"[{task_id}] Loading Iceberg catalog")
+        catalog_key: str = json.dumps(catalog_configs, sort_keys=True)
         try:
-            catalog = load_catalog("iceberg", **catalog_configs)
+            catalog: Catalog = _get_catalog(catalog_key)
             influxdb3_local.info(f"[{task_id}] Catalog loaded successfully.")
         except Exception as e:
             influxdb3_local.error(f"[{task_id}] Error while loading catalog: {e}")
             return
 
-        # Create the namespace if it doesn't exist
-        catalog.create_namespace_if_not_exists(namespace)
-
-        # Create the table if it doesn't exist
-        if not catalog.table_exists(full_table_name):
-            schema: Schema = df_to_iceberg_schema(df)
-            catalog.create_table(full_table_name, schema)
-            influxdb3_local.info(f"[{task_id}] Table created successfully.")
-
-        table: Table = catalog.load_table(full_table_name)
+        # Table handles are reused across runs; a cached table is known to exist
+        cache_key: tuple[str, str] = (catalog_key, full_table_name)
+        cached: tuple[Table, pa.Schema, int] | None = _TABLE_CACHE.pop(cache_key, None)
+        if cached is None:
+            # Create the namespace if it doesn't exist
+            catalog.create_namespace_if_not_exists(namespace)
+            try:
+                table: Table = catalog.load_table(full_table_name)
+            except NoSuchTableError:
+                # Create the table, inferring its schema from the records
+                try:
+                    schema: Schema = records_to_iceberg_schema(results)
+                except Exception as e:
+                    influxdb3_local.error(
+                        f"[{task_id}] Error while inferring table schema: {e}"
+                    )
+                    return
+                table = catalog.create_table(full_table_name, schema)
+                influxdb3_local.info(f"[{task_id}] Table created successfully.")
+            pa_schema: pa.Schema = table.schema().as_arrow()
+        else:
+            table, pa_schema, schema_id = cached
+            # Pick up commits made by other writers since the previous run
+            table.refresh()
+            if table.metadata.current_schema_id != schema_id:
+                pa_schema = refresh_arrow_schema(table, pa_schema)
 
         # Handle schema differences proactively if auto_update_schema is enabled
         if auto_update_schema:
-            schema_changed, df = update_schema_and_dataframe(table, df, influxdb3_local, task_id)
+            schema_changed: bool = update_table_schema(table, results, influxdb3_local, task_id)
             if schema_changed:
-                # Reload table to get updated schema
-                table = catalog.load_table(full_table_name)
+                # The schema commit updates table metadata in place
+                pa_schema = refresh_arrow_schema(table, pa_schema)
                 influxdb3_local.info(f"[{task_id}] Schema updated proactively")
 
-        pa_schema: pa.Schema = table.schema().as_arrow()
-        result_arrows: pa.Table = pa.Table.from_pandas(df, schema=pa_schema)
-        table.append(result_arrows)
+        append_record_batches(table, iter_record_batches(results, pa_schema))
         influxdb3_local.info(
-            f"[{task_id}] Data appended to table successfully ({len(result_arrows)} rows)."
+            f"[{task_id}] Data appended to table successfully ({len(results)} rows)."
         )
+        # Only cache handles that just completed an append, so failures force a reload
+        _TABLE_CACHE[cache_key] = (table, pa_schema, table.metadata.current_schema_id)
 
     except Exception as e:
         influxdb3_local.error(f"Error: {e}")
@@ -705,20 +883,26 @@ def process_request(
                 "namespace": str,                 # Optional. Target namespace for the Iceberg catalog (default: "default").
                 "table_name": str,                # Optional. Target table name in the Iceberg catalog (default: measurement name).
                 "batch_size": str,                # Optional. Batch size duration for processing, e.g. "1d", "12h" (default: "1d").
+                "commit_every": int,              # Optional. Number of batches committed together in one snapshot (default: 8).
+                "min_commit_rows": int,           # Optional. Row count that triggers a commit before commit_every is reached (default: 500000).
+                "min_commit_bytes": int,          # Optional. Buffered Arrow bytes that trigger a commit before commit_every is reached (default: 134217728).
+                "max_batch_rows": int,            # Optional. Row count above which upcoming batches are halved in duration (default: 1000000).
                 "backfill_start": str,            # Optional. ISO 8601 datetime string with timezone for start of backfill window.
                 "backfill_end": str,              # Optional. ISO 8601 datetime string with timezone for end of backfill window.
-                "auto_update_schema": str         # Optional. Automatically update schema when data doesn't match (default: false).
+                "auto_update_schema": str,        # Optional. Automatically update schema when data doesn't match (default: false).
+                "stage_parquet": str,             # Optional. Write Parquet files and register them with one add_files commit (default: false).
+                "log_batches": str                # Optional. Log progress of every batch; errors and the final summary are always logged (default: true).
             }
         args: Optional additional arguments.
 
     Returns:
         dict: Result message with success or error information.
     """
-    task_id = str(uuid.uuid4())
+    task_id = uuid.uuid4().hex
     influxdb3_local.info(f"[{task_id}] Received request for data replication to Iceberg.")
 
     if request_body:
-        data: dict = json.loads(request_body)
+        data: dict = _json_loads(request_body)
     else:
         influxdb3_local.error(f"[{task_id}] No request body provided.")
         return {"message": f"[{task_id}] Error: No request body provided."}
@@ -749,18 +933,20 @@ def process_request(
 
         catalog_configs: dict = data["catalog_configs"]
         influxdb3_local.info(f"[{task_id}] Catalog configs received: {catalog_configs}")
-        included_fields: list | None = data.get("included_fields", None)
-        excluded_fields: list = data.get("excluded_fields", [])
+        included_fields: frozenset = frozenset(data.get("included_fields") or ())
+        excluded_fields: frozenset = frozenset(data.get("excluded_fields") or ())
         namespace: str = data.get("namespace", "default")
         table_name: str = data.get("table_name", measurement)
         auto_update_schema: bool = str(data.get("auto_update_schema", False)).lower() == "true"
+        stage_parquet: bool = str(data.get("stage_parquet", False)).lower() == "true"
+        log_batches: bool = str(data.get("log_batches", True)).lower() == "true"
         full_table_name: str = f"{namespace}.{table_name}"
         influxdb3_local.info(f"[{task_id}] Target Iceberg table: {full_table_name}")
         influxdb3_local.info(f"[{task_id}] Auto update schema: {auto_update_schema}")
+        influxdb3_local.info(f"[{task_id}] Stage Parquet files: {stage_parquet}")
 
         # Get data
-        tags: list = get_tag_names(influxdb3_local, measurement, task_id)
-        fields: list = get_fields_names(influxdb3_local, measurement, task_id)
+        tags, fields = get_columns(influxdb3_local, measurement, task_id)
 
         # Filter tags using included_fields/excluded_fields parameters
         if included_fields:
@@ -786,9 +972,17 @@ def process_request(
             data.get("batch_size", "1d"), task_id
         )
         backfill_start, backfill_end = parse_backfill_window(data, task_id)
+        commit_every: int = int(data.get("commit_every", 8))
+        min_commit_rows: int = int(data.get("min_commit_rows", 500_000))
+        min_commit_bytes: int = int(data.get("min_commit_bytes", 128 * 1024 * 1024))
+        max_batch_rows: int = int(data.get("max_batch_rows", 1_000_000))
+        if min(commit_every, min_commit_rows, min_commit_bytes, max_batch_rows) < 1:
+            raise Exception(
+                f"[{task_id}] commit_every, min_commit_rows, min_commit_bytes and max_batch_rows must be positive integers."
+            )
 
         if backfill_start is None:
-            q: str = f"SELECT MIN(time) as _t FROM {measurement}"
+            q: str = f"SELECT MIN(time) as _t FROM {quote_identifier(measurement)}"
             res: list = influxdb3_local.query(q)
             oldest: int = res[0].get("_t")
             backfill_start: datetime = datetime.fromtimestamp(
@@ -802,129 +996,293 @@ def process_request(
         # Load catalog
         try:
             influxdb3_local.info(f"[{task_id}] Loading Iceberg catalog...")
-            catalog = load_catalog("iceberg", **catalog_configs)
+            catalog: Catalog = _get_catalog(json.dumps(catalog_configs, sort_keys=True))
             influxdb3_local.info(f"[{task_id}] Catalog loaded successfully.")
         except Exception as e:
             influxdb3_local.error(f"[{task_id}] Error while loading catalog: {e}")
             return {"message": f"[{task_id}] Error while loading catalog: {e}"}
 
-        # Create the namespace if it doesn't exist
-        catalog.create_namespace_if_not_exists(namespace)
-
         # Process data
-        cursor: datetime = backfill_start
         total_source_records: int = 0
         total_written_records: int = 0
+        # Batches and rows buffered successfully but lost in a failed commit
+        failed_batches: int = 0
+        failed_records: int = 0
         batch_count: int = 0
         is_first_valid_batch: bool = True
         table: Table | None = None
         pa_schema: pa.Schema | None = None
 
-        while cursor < backfill_end:
-            batch_count += 1
-            batch_end = min(cursor + batch_size, backfill_end)
-
-            query: str = generate_query(
-                measurement,
-                tags,
-                fields_to_query,
-                cursor,
-                batch_end,
-            )
-
-            batch_data: list = influxdb3_local.query(query)
-            batch_source_count = len(batch_data)
-            total_source_records += batch_source_count
+        # Batches are buffered and committed together to avoid one snapshot per batch
+        pending_batches: list[pa.RecordBatch] = []
+        pending_rows: int = 0
+        pending_bytes: int = 0
+        pending_count: int = 0
+
+        # With stage_parquet, each group of batches becomes one Parquet file and
+        # all files are added to the table in a single commit
+        staged_files: list[str] = []
+        staged_rows: int = 0
+        staged_count: int = 0
+
+        # Commits run on a single background thread, one at a time and in order,
+        # while the next windows are queried and converted. Only Iceberg I/O runs
+        # there; results are logged from this thread: (future, rows, batches)
+        commit: tuple[Future, int, int] | None = None
+
+        def write_batches(schema: pa.Schema, batches: list[pa.RecordBatch]) -> str | None:
+            # Returns the location of the staged Parquet file, if any
+            if stage_parquet:
+                return write_parquet_file(table, schema, batches)
+            append_record_batches(table, pa.RecordBatchReader.from_batches(schema, batches))
+            return None
+
+        def wait_for_commit() -> None:
+            nonlocal commit, total_written_records, staged_rows, staged_count
+            nonlocal failed_batches, failed_records
+            if commit is None:
+                return
+            future, rows, count = commit
+            commit = None
+            try:
+                location: str | None = future.result()
+            except Exception as e:
+                failed_batches += count
+                failed_records += rows
+                influxdb3_local.error(
+                    f"[{task_id}] Error while committing {count} batches ({rows} rows) to table {full_table_name}: {e}"
+                )
+                return
+            if location is not None:
+                staged_files.append(location)
+                staged_rows += rows
+                staged_count += count
+                influxdb3_local.info(
+                    f"[{task_id}] Staged {count} batches in {location} ({rows} rows)."
+                )
+            else:
+                total_written_records += rows
+                influxdb3_local.info(
+                    f"[{task_id}] Committed {count} batches to table {full_table_name} ({rows} rows)."
+                )
 
-            # Log batch source data metrics
-            source_columns = (
-                list(batch_data[0].keys()) if batch_source_count > 0 else []
-            )
-            batch_source_log: dict = {
-                "batch": batch_count,
-                "time_range": f"{cursor.isoformat()} to {batch_end.isoformat()}",
-                "source_records": batch_source_count,
-                "source_columns": source_columns[
-                    :10
-                ],  # Limit to first 10 columns to avoid huge logs
-                "source_measurement": measurement,
-            }
-            influxdb3_local.info(
-                f"[{task_id}] Batch source data retrieved", batch_source_log
+        def commit_pending() -> None:
+            nonlocal pending_batches, pending_rows, pending_bytes, pending_count, commit
+            if not pending_batches:
+                return
+            wait_for_commit()
+            commit = (
+                commit_executor.submit(write_batches, pa_schema, pending_batches),
+                pending_rows,
+                pending_count,
             )
-            if batch_source_count == 0:
+            pending_batches = []
+            pending_rows = 0
+            pending_bytes = 0
+            pending_count = 0
+
+        def commit_staged() -> None:
+            nonlocal staged_rows, staged_count, total_written_records
+            nonlocal failed_batches, failed_records
+            # Also makes the table safe to modify from this thread again
+            wait_for_commit()
+            if not staged_files:
+                return
+            try:
+                table.add_files(staged_files)
+                total_written_records += staged_rows
                 influxdb3_local.info(
-                    f"[{task_id}] No data in batch {batch_count}, skipping"
+                    f"[{task_id}] Added {len(staged_files)} Parquet files to table {full_table_name} ({staged_rows} rows)."
                 )
-                cursor = batch_end
-                continue
-
-            success: bool = False
-            error: str | None = None
-
-            # Transform and replicate data
+            except Exception as e:
+                failed_batches += staged_count
+                failed_records += staged_rows
+                influxdb3_local.error(
+                    f"[{task_id}] Error while adding {len(staged_files)} Parquet files ({staged_rows} rows) to table {full_table_name}: {e}"
+                )
+            finally:
+                staged_files.clear()
+                staged_rows = 0
+                staged_count = 0
+
+        def log_batch_result(number: int, rows: int, error: str | None) -> None:
+            if log_batches:
+                batch_result_log: dict = {
+                    "batch": number,
+                    "success": error is None,
+                    "source_records": rows,
+                    "buffered_records": rows if error is None else 0,
+                    "error": error,
+                }
+                influxdb3_local.info(f"[{task_id}] Batch processed", batch_result_log)
+
+        # The last queried window is converted to Arrow on a worker thread while
+        # the next window is queried: (future, batch number, start, end, rows)
+        converting: tuple[Future, int, str, str, int] | None = None
+
+        def convert_window(records: list, schema: pa.Schema) -> list[pa.RecordBatch]:
+            return list(iter_record_batches(records, schema))
+
+        def buffer_converted() -> None:
+            nonlocal converting, pending_rows, pending_bytes, pending_count
+            if converting is None:
+                return
+            future, number, start_str, end_str, rows = converting
+            converting = None
             try:
-                # Convert to DataFrame and convert 'time' to datetime
-                batch_df: pd.DataFrame = pd.DataFrame.from_records(batch_data)
-                batch_df["time"] = pd.to_datetime(
-                    batch_df["time"], unit="ns"
-                )  # Assuming 'time' column exists and is the timestamp
+                record_batches: list[pa.RecordBatch] = future.result()
+            except Exception as e:
+                influxdb3_local.error(
+                    f"[{task_id}] Error while appending data from {start_str} to {end_str} on batch {number} to table {full_table_name}: {e}"
+                )
+                log_batch_result(number, rows, str(e))
+                return
+            pending_batches.extend(record_batches)
+            pending_bytes += sum(record_batch.nbytes for record_batch in record_batches)
+            pending_rows += rows
+            pending_count += 1
+            if log_batches:
                 influxdb3_local.info(
-                    f"[{task_id}] Successfully converted 'time' column to datetime on batch {batch_count}."
+                    f"[{task_id}] Data from {start_str} to {end_str} on batch {number} buffered for table {full_table_name} ({rows} rows)."
                 )
+            log_batch_result(number, rows, None)
+
+            if (
+                pending_count >= commit_every
+                or pending_rows >= min_commit_rows
+                or pending_bytes >= min_commit_bytes
+            ):
+                commit_pending()
+
+        def flush_all() -> None:
+            # Writes the converted, buffered and staged batches and awaits every commit
+            buffer_converted()
+            commit_pending()
+            commit_staged()
+
+        # Built once; every window runs the same query with different parameters
+        query: str = generate_query(measurement, tags, fields_to_query)
+
+        # Shrinks when a window returns more than max_batch_rows rows, since the
+        # query API returns each window as one fully materialized list
+        window_size: timedelta = batch_size
+
+        def iter_windows():
+            # Each window's end is the next window's start, so every bound is formatted once
+            window_start: datetime = backfill_start
+            start_param: str = backfill_start.isoformat()
+            while window_start < backfill_end:
+                window_end: datetime = min(window_start + window_size, backfill_end)
+                end_param: str = window_end.isoformat()
+                yield {"start": start_param, "end": end_param}
+                window_start, start_param = window_end, end_param
+
+        # Windows are queried on this thread, as the engine API is only called
+        # from the plugin's own thread, while the previous window is converted
+        # and earlier batches are committed in the background
+        with (
+            ThreadPoolExecutor(max_workers=1) as convert_executor,
+            ThreadPoolExecutor(max_workers=1) as commit_executor,
+        ):
+            try:
+                for params in iter_windows():
+                    # Window bounds as already formatted for the query, reused in the logs
+                    cursor_str, batch_end_str = params["start"], params["end"]
+                    batch_count += 1
+
+                    batch_data: list = influxdb3_local.query(query, params)
+                    buffer_converted()
+                    batch_source_count = len(batch_data)
+                    total_source_records += batch_source_count
+                    if batch_source_count > max_batch_rows and window_size > MIN_BATCH_SIZE:
+                        window_size = max(window_size / 2, MIN_BATCH_SIZE)
+                        influxdb3_local.info(
+                            f"[{task_id}] Batch {batch_count} returned {batch_source_count} rows (max_batch_rows={max_batch_rows}), reducing batch size to {window_size} for upcoming batches"
+                        )
 
-                batch_df["time"] = batch_df["time"].dt.tz_localize(None)
-                batch_df["time"] = batch_df["time"].astype(
-                    "datetime64[us]"
-                )  # Ensure time is microsecond datetime for Iceberg
-
-                if is_first_valid_batch:
-                    # Create the table if it doesn't exist
-                    if not catalog.table_exists(full_table_name):
-                        schema: Schema = df_to_iceberg_schema(batch_df)
-                        catalog.create_table(full_table_name, schema)
+                    # Log batch source data metrics
+                    if log_batches:
+                        source_columns = (
+                            list(batch_data[0].keys()) if batch_source_count > 0 else []
+                        )
+                        batch_source_log: dict = {
+                            "batch": batch_count,
+                            "time_range": f"{cursor_str} to {batch_end_str}",
+                            "source_records": batch_source_count,
+                            "source_columns": source_columns[
+                                :10
+                            ],  # Limit to first 10 columns to avoid huge logs
+                            "source_measurement": measurement,
+                        }
                         influxdb3_local.info(
-                            f"[{task_id}] Table {full_table_name} created successfully."
+                            f"[{task_id}] Batch source data retrieved", batch_source_log
+                        )
+                    if batch_source_count == 0:
+                        if log_batches:
+                            influxdb3_local.info(
+                                f"[{task_id}] No data in batch {batch_count}, skipping"
+                            )
+                        continue
+
+                    # Transform and replicate data
+                    try:
+                        if is_first_valid_batch:
+                            # Nothing is created in the catalog until a window returns data
+                            catalog.create_namespace_if_not_exists(namespace)
+                            try:
+                                table = catalog.load_table(full_table_name)
+                            except NoSuchTableError:
+                                schema: Schema = records_to_iceberg_schema(batch_data)
+                                table = catalog.create_table(full_table_name, schema)
+                                influxdb3_local.info(
+                                    f"[{task_id}] Table {full_table_name} created successfully."
+                                )
+                            pa_schema = table.schema().as_arrow()
+                            is_first_valid_batch = False
+                            if stage_parquet and not table.spec().is_unpartitioned():
+                                influxdb3_local.warn(
+                                    f"[{task_id}] stage_parquet is only supported for unpartitioned tables, appending instead."
+                                )
+                                stage_parquet = False
+
+                        # Handle schema differences proactively if auto_update_schema is enabled
+                        if auto_update_schema:
+                            # Buffered batches follow the current schema, so commit them before it changes
+                            if not set().union(*batch_data).issubset(pa_schema.names):
+                                commit_pending()
+                                commit_staged()
+                            schema_changed: bool = update_table_schema(
+                                table, batch_data, influxdb3_local, task_id
+                            )
+                            if schema_changed:
+                                # The schema commit updates table metadata in place
+                                pa_schema = refresh_arrow_schema(table, pa_schema)
+                                influxdb3_local.info(f"[{task_id}] Schema updated proactively on batch {batch_count}")
+
+                        converting = (
+                            convert_executor.submit(convert_window, batch_data, pa_schema),
+                            batch_count,
+                            cursor_str,
+                            batch_end_str,
+                            batch_source_count,
                         )
+                    except Exception as e:
+                        influxdb3_local.error(
+                            f"[{task_id}] Error while appending data from {cursor_str} to {batch_end_str} on batch {batch_count} to table {full_table_name}: {e}"
+                        )
+                        log_batch_result(batch_count, batch_source_count, str(e))
 
-                    table = catalog.load_table(full_table_name)
-                    pa_schema = table.schema().as_arrow()
-                    is_first_valid_batch = False
-
-                # Handle schema differences proactively if auto_update_schema is enabled
-                if auto_update_schema:
-                    schema_changed, batch_df = update_schema_and_dataframe(table, batch_df, influxdb3_local, task_id)
-                    if schema_changed:
-                        # Reload table to get updated schema
-                        table = catalog.load_table(full_table_name)
-                        pa_schema = table.schema().as_arrow()
-                        influxdb3_local.info(f"[{task_id}] Schema updated proactively on batch {batch_count}")
-
-                result_arrows: pa.Table = pa.Table.from_pandas(
-                    batch_df, schema=pa_schema
-                )
-                table.append(result_arrows)
-                success = True
-                total_written_records += batch_source_count
-                influxdb3_local.info(
-                    f"[{task_id}] Data from {cursor.isoformat()} to {batch_end.isoformat()} on batch {batch_count} appended to table {full_table_name} successfully ({batch_source_count} rows)."
-                )
-            except Exception as e:
-                error = str(e)
+                    # Only the Arrow batches are buffered; the query rows are released
+                    # once converted instead of staying alive until the next window
+                    del batch_data
+            except Exception:
+                # Windows buffered before the failure are still written
+                flush_all()
                 influxdb3_local.error(
-                    f"[{task_id}] Error while appending data from {cursor.isoformat()} to {batch_end.isoformat()} on batch {batch_count} to table {full_table_name}: {e}"
+                    f"[{task_id}] Replication stopped on batch {batch_count} after writing {total_written_records} rows to table {full_table_name}"
                 )
-
-            cursor = batch_end
-
-            batch_result_log = {
-                "batch": batch_count,
-                "success": success,
-                "source_records": batch_source_count,
-                "written_records": batch_source_count if success else 0,
-                "error": error or None,
-            }
-            influxdb3_local.info(f"[{task_id}] Batch processed", batch_result_log)
+                raise
+            flush_all()
 
         duration: float = time.time() - start_process_time
 
@@ -934,16 +1292,26 @@ def process_request(
             "execution_time_seconds": round(duration, 2),
             "total_source_records": total_source_records,
             "total_written_records": total_written_records,
+            "failed_batches": failed_batches,
+            "failed_records": failed_records,
             "source_measurement": measurement,
             "target_table": full_table_name,
             "time_range": f"{backfill_start.isoformat()} to {backfill_end.isoformat()}",
         }
-        influxdb3_local.info(
-            f"[{task_id}] Replication to Iceberg completed", final_summary
-        )
+        if failed_batches:
+            influxdb3_local.error(
+                f"[{task_id}] Replication to Iceberg completed with {failed_batches} batches ({failed_records} rows) not written",
+                final_summary,
+            )
+            status: str = "completed with errors"
+        else:
+            influxdb3_local.info(
+                f"[{task_id}] Replication to Iceberg completed", final_summary
+            )
+            status = "completed"
 
         return {
-            "message": f"[{task_id}] Replication to Iceberg completed with summary: {final_summary}"
+            "message": f"[{task_id}] Replication to Iceberg {status} with summary: {final_summary}"
         }
 
     except Exception as e:
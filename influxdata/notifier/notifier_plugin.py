@@ -6,17 +6,64 @@
 
 import asyncio
 import base64
+import contextlib
 import json
 import os
 import random
 import time
 import uuid
+from collections.abc import Callable, Mapping
+from functools import lru_cache
 from json import JSONDecodeError
+from types import MappingProxyType
 
 import httpx
 from twilio.base.exceptions import TwilioRestException
 from twilio.rest import Client
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; fall back to the stdlib parser and encoder
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# Fields every request body must contain
+REQUIRED_FIELDS: frozenset[str] = frozenset(("senders_config", "notification_text"))
+
+# Connection pool limits of the HTTP client shared by webhook senders in a request
+WEBHOOK_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+def retry_delay(retry: int, base: float = 0.25, cap: float = 8.0) -> float:
+    """
+    Returns a jittered exponential backoff delay in seconds.
+
+    Args:
+        retry (int): Zero-based index of the retry about to be made.
+        base (float): Lower bound of every delay.
+        cap (float): Upper bound of every delay.
+
+    Returns:
+        float: A random delay between base and base * 3 * 2**retry, capped at cap.
+    """
+    return min(cap, random.uniform(base, base * 3 * 2**retry))
+
+
+def mask_phone_number(number: str) -> str:
+    """Masks a phone number for logging, keeping its first five and, if long enough, last three characters."""
+    return f"{number[:5]}***{number[-3:] if len(number) > 8 else '***'}"
+
+
+@lru_cache(maxsize=8)
+def get_twilio_client(account_sid: str, auth_token: str) -> Client:
+    """Returns a Twilio client for the credentials, reusing its HTTP session across calls."""
+    return Client(account_sid, auth_token)
+
 
 def send_sms_via_twilio(influxdb3_local, params: dict, task_id: str) -> bool:
     """
@@ -52,12 +99,13 @@ def send_sms_via_twilio(influxdb3_local, params: dict, task_id: str) -> bool:
     notification_text: str = params["notification_text"]
     message_length: int = len(notification_text)
     max_retries: int = 3
+    masked_to: str = mask_phone_number(to_number)
 
-    influxdb3_local.info(f"[{task_id}] Starting SMS notification (from={from_number}, to={to_number[:5]}***{to_number[-3:] if len(to_number) > 8 else '***'}, message_length={message_length})")
+    influxdb3_local.info(f"[{task_id}] Starting SMS notification (from={from_number}, to={masked_to}, message_length={message_length})")
 
+    client: Client = get_twilio_client(account_sid, auth_token)
     for attempt in range(1, max_retries + 1):
         try:
-            client = Client(account_sid, auth_token)
             message = client.messages.create(
                 to=to_number, from_=from_number, body=notification_text
             )
@@ -71,10 +119,9 @@ def send_sms_via_twilio(influxdb3_local, params: dict, task_id: str) -> bool:
             )
 
         if attempt < max_retries:
-            wait: float = random.uniform(1, 4)
-            time.sleep(wait)
+            time.sleep(retry_delay(attempt - 1))
 
-    influxdb3_local.error(f"[{task_id}] SMS notification failed permanently (max_attempts={max_retries}, from={from_number}, to={to_number[:5]}***{to_number[-3:] if len(to_number) > 8 else '***'})")
+    influxdb3_local.error(f"[{task_id}] SMS notification failed permanently (max_attempts={max_retries}, from={from_number}, to={masked_to})")
     return False
 
 
@@ -112,12 +159,13 @@ def send_whatsapp_via_twilio(influxdb3_local, params: dict, task_id: str) -> boo
     body: str = params["notification_text"]
     message_length: int = len(body)
     max_retries: int = 3
+    masked_to: str = mask_phone_number(to_number)
 
-    influxdb3_local.info(f"[{task_id}] Starting WhatsApp notification (from=whatsapp:{from_number}, to=whatsapp:{to_number[:5]}***{to_number[-3:] if len(to_number) > 8 else '***'}, message_length={message_length})")
+    influxdb3_local.info(f"[{task_id}] Starting WhatsApp notification (from=whatsapp:{from_number}, to=whatsapp:{masked_to}, message_length={message_length})")
 
+    client: Client = get_twilio_client(account_sid, auth_token)
     for attempt in range(1, max_retries + 1):
         try:
-            client = Client(account_sid, auth_token)
             message = client.messages.create(
                 to=f"whatsapp:{to_number}", from_=f"whatsapp:{from_number}", body=body
             )
@@ -131,15 +179,18 @@ def send_whatsapp_via_twilio(influxdb3_local, params: dict, task_id: str) -> boo
             )
 
         if attempt < max_retries:
-            wait: float = random.uniform(1, 4)
-            time.sleep(wait)
+            time.sleep(retry_delay(attempt - 1))
 
-    influxdb3_local.error(f"[{task_id}] WhatsApp notification failed permanently (max_attempts={max_retries}, from=whatsapp:{from_number}, to=whatsapp:{to_number[:5]}***{to_number[-3:] if len(to_number) > 8 else '***'})")
+    influxdb3_local.error(f"[{task_id}] WhatsApp notification failed permanently (max_attempts={max_retries}, from=whatsapp:{from_number}, to=whatsapp:{masked_to})")
     return False
 
 
 async def alert_async(
-    influxdb3_local, endpoint_type: str, args: dict, task_id: str
+    influxdb3_local,
+    endpoint_type: str,
+    args: dict,
+    task_id: str,
+    client: httpx.AsyncClient | None = None,
 ) -> bool:
     """
     Send asynchronous alerts with retry logic.
@@ -149,6 +200,7 @@ async def alert_async(
         endpoint_type (str): Type of endpoint to send alert to
         args (dict): configuration arguments
         task_id (str: Unique task identifier
+        client (httpx.AsyncClient): HTTP client to send with; a new one is opened if omitted
     """
     influxdb3_local.info(f"[{task_id}] Sending notification via {endpoint_type}")
     webhook_url: str = args.get(f"{endpoint_type}_webhook_url")
@@ -156,16 +208,20 @@ async def alert_async(
         influxdb3_local.error(f"[{task_id}] Webhook URL not found for {endpoint_type}")
         return False
 
-    payload: dict = build_payload(endpoint_type, args)
-    headers: dict = parse_headers(influxdb3_local, args, endpoint_type, task_id)
+    # The payload is encoded once and reused by every attempt
+    content: bytes = _json_dumps(build_payload(endpoint_type, args))
+    headers = httpx.Headers(parse_headers(influxdb3_local, args, endpoint_type, task_id))
+    headers.setdefault("Content-Type", "application/json")
     max_retries: int = 3
 
-    async with httpx.AsyncClient() as client:
+    async with contextlib.AsyncExitStack() as stack:
+        if client is None:
+            client = await stack.enter_async_context(httpx.AsyncClient())
         for attempt in range(max_retries):
             try:
                 response = await client.post(
                     webhook_url,
-                    json=payload,
+                    content=content,
                     headers=headers,
                     timeout=10,
                 )
@@ -189,13 +245,93 @@ async def alert_async(
             except Exception as e:
                 influxdb3_local.error(f"[{task_id}] Request error: {str(e)}")
             if attempt < max_retries - 1:
-                await asyncio.sleep(2**attempt)
+                await asyncio.sleep(retry_delay(attempt))
         influxdb3_local.error(
             f"[{task_id}] Max retries reached. Alert via {endpoint_type} not sent."
         )
         return False
 
 
+class LogBuffer:
+    """
+    Collects the log calls of a sender running in a worker thread.
+
+    The engine API is only called from the plugin's thread, so the records
+    are replayed on influxdb3_local once the sender has finished.
+    """
+
+    def __init__(self):
+        self.records: list[tuple[str, tuple]] = []
+
+    def info(self, *args) -> None:
+        self.records.append(("info", args))
+
+    def warn(self, *args) -> None:
+        self.records.append(("warn", args))
+
+    def error(self, *args) -> None:
+        self.records.append(("error", args))
+
+    def replay(self, influxdb3_local) -> None:
+        for level, args in self.records:
+            getattr(influxdb3_local, level)(*args)
+        self.records.clear()
+
+
+async def send_in_thread(
+    influxdb3_local, send_function: Callable, configs: dict, task_id: str
+) -> bool:
+    """
+    Runs a blocking sender in a worker thread and logs its messages from the calling thread.
+
+    Args:
+        influxdb3_local: InfluxDB client instance
+        send_function (Callable): blocking sender such as send_sms_via_twilio
+        configs (dict): sender configuration
+        task_id (str): Unique task identifier
+
+    Returns:
+        bool: the sender's result
+    """
+    log = LogBuffer()
+    try:
+        return await asyncio.to_thread(send_function, log, configs, task_id)
+    finally:
+        log.replay(influxdb3_local)
+
+
+async def send_notifications(
+    influxdb3_local, senders: list[tuple[str, bool, Callable, dict]], task_id: str
+) -> list[bool]:
+    """
+    Send notifications for several senders concurrently.
+
+    Webhook senders share one HTTP client; the blocking Twilio senders run in
+    worker threads, with their log messages written from this thread.
+
+    Args:
+        influxdb3_local: InfluxDB client instance
+        senders (list): (sender name, is_async, send function, configuration) tuples
+        task_id (str): Unique task identifier
+
+    Returns:
+        list[bool]: send results in the order of senders; False for a sender that raised
+    """
+    async with httpx.AsyncClient(limits=WEBHOOK_LIMITS) as client:
+        tasks: list = [
+            send_function(influxdb3_local, sender, configs, task_id, client)
+            if is_async
+            else send_in_thread(influxdb3_local, send_function, configs, task_id)
+            for sender, is_async, send_function, configs in senders
+        ]
+        results: list = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for (sender, _, _, _), result in zip(senders, results):
+        if isinstance(result, BaseException):
+            influxdb3_local.error(f"[{task_id}] Unexpected error while sending via {sender}: {result!r}")
+    return [result if isinstance(result, bool) else False for result in results]
+
+
 def build_payload(endpoint_type: str, args: dict) -> dict:
     """
     Build notification payload based on endpoint type.
@@ -217,7 +353,17 @@ def build_payload(endpoint_type: str, args: dict) -> dict:
     return payloads.get(endpoint_type, {"message": args["notification_text"]})
 
 
-def parse_headers(influxdb3_local, args: dict, key: str, task_id: str) -> dict:
+@lru_cache(maxsize=64)
+def decode_headers(headers_b64: str) -> MappingProxyType:
+    """Decodes base64-encoded JSON headers into a read-only mapping shared between calls."""
+    padding = len(headers_b64) % 4
+    if padding:
+        headers_b64 += "=" * (4 - padding)
+    headers_json = base64.b64decode(headers_b64).decode("utf-8")
+    return MappingProxyType(json.loads(headers_json))
+
+
+def parse_headers(influxdb3_local, args: dict, key: str, task_id: str) -> Mapping:
     """
     Parse and validate headers from base64 encoded string.
 
@@ -228,37 +374,42 @@ def parse_headers(influxdb3_local, args: dict, key: str, task_id: str) -> dict:
         task_id (str): Unique task identifier
 
     Returns:
-        dict: Decoded headers or empty dict if invalid
+        Mapping: Decoded headers (read-only, cached per encoded value) or empty dict if invalid
     """
     try:
         headers_b64: str = args.get(f"{key}_headers", "")
         if not headers_b64:
             return {}
 
-        padding = len(headers_b64) % 4
-        if padding:
-            headers_b64 += "=" * (4 - padding)
-        headers_json = base64.b64decode(headers_b64).decode("utf-8")
-        decoded_headers = json.loads(headers_json)
-        return decoded_headers
+        return decode_headers(headers_b64)
     except Exception:
         influxdb3_local.warn(f"[{task_id}] Failed to parse headers for {key}")
         return {}
 
 
+# Send function per sender, flagged with whether it is a coroutine function
+SENDER_DISPATCH: dict[str, tuple[bool, Callable]] = {
+    "slack": (True, alert_async),
+    "discord": (True, alert_async),
+    "http": (True, alert_async),
+    "whatsapp": (False, send_whatsapp_via_twilio),
+    "sms": (False, send_sms_via_twilio),
+}
+
+
 def process_request(
     influxdb3_local, query_parameters, request_headers, request_body, args=None
 ):
     """
     Process an incoming HTTP request to trigger notifications via configured senders.
     """
-    task_id: str = str(uuid.uuid4())
+    task_id: str = uuid.uuid4().hex
     influxdb3_local.info(f"[{task_id}] Starting request process")
 
     # Process the request body
     if request_body:
         try:
-            data: dict = json.loads(request_body)
+            data: dict = _json_loads(request_body)
         except JSONDecodeError:
             influxdb3_local.error(f"[{task_id}] Invalid JSON in request body.")
             return {"status": "failed", "message": "Invalid JSON in request body."}
@@ -266,35 +417,36 @@ def process_request(
         influxdb3_local.error(f"[{task_id}] No request body provided.")
         return {"status": "failed", "message": "No request body provided."}
 
-    if "senders_config" not in data or "notification_text" not in data:
-        influxdb3_local.error(f"[{task_id}] Missing required fields in request body: 'senders_config' or 'notification_text'.")
+    missing_fields = REQUIRED_FIELDS - data.keys() if isinstance(data, dict) else REQUIRED_FIELDS
+    if missing_fields:
+        missing: str = ", ".join(f"'{field}'" for field in sorted(missing_fields))
+        influxdb3_local.error(f"[{task_id}] Missing required fields in request body: {missing}.")
         return {
             "status": "failed",
-            "message": "Missing required fields: 'senders_config' or 'notification_text'."
+            "message": f"Missing required fields: {missing}."
         }
 
-    senders_functions: dict = {
-        "slack": alert_async,
-        "discord": alert_async,
-        "http": alert_async,
-        "whatsapp": send_whatsapp_via_twilio,
-        "sms": send_sms_via_twilio,
-    }
-
     results: dict = {}
+    valid_senders: list[tuple[str, bool, Callable, dict]] = []
     for sender, configs in data["senders_config"].items():
         configs["notification_text"] = data["notification_text"]
 
-        if sender in senders_functions and sender in ["slack", "discord", "http"]:
-            result: bool = asyncio.run(
-                senders_functions[sender](influxdb3_local, sender, configs, task_id)
-            )
-        elif sender in senders_functions and sender in ["whatsapp", "sms"]:
-            result: bool = senders_functions[sender](influxdb3_local, configs, task_id)
-        else:
+        dispatch: tuple[bool, Callable] | None = SENDER_DISPATCH.get(sender)
+        if dispatch is None:
             influxdb3_local.warn(f"[{task_id}] Invalid sender: {sender}")
-            result: str = f"Invalid sender"
+            results[sender] = "Invalid sender"
+            continue
+
+        # Sent together below; the result is filled in once all senders finish
+        is_async, send_function = dispatch
+        valid_senders.append((sender, is_async, send_function, configs))
+        results[sender] = None
 
-        results[sender] = result
+    if valid_senders:
+        send_results: list[bool] = asyncio.run(
+            send_notifications(influxdb3_local, valid_senders, task_id)
+        )
+        for (sender, _, _, _), result in zip(valid_senders, send_results):
+            results[sender] = result
     influxdb3_local.info(f"[{task_id}] Finished processing all senders.")
     return {"status": "success", "message": "Request processed", "results": results}
@@ -36,24 +36,128 @@
 }
 """
 
+import asyncio
 import json
-import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
-from typing import Any, Dict, Optional
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+import os
+import socket
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+import aiohttp
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
 
 # Default True so errors before args are parsed log in full; set from args
 # (default False) once known so runtime errors don't leak values.
 _ENABLE_FULL_LOGGING: bool = True
 
+# Upper bound on stations fetched per scheduled call
+MAX_STATIONS = 256
+
+# Per-request timeout for NWS API calls
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# All stations share one host; cap its connections so larger station lists
+# queue on warm keep-alive connections instead of opening one TLS session each
+MAX_CONNECTIONS_PER_HOST = 10
+
+# Resolved api.weather.gov addresses are reused across scheduled calls for this long
+DNS_CACHE_TTL = 300
+_DNS_CACHE: Dict[tuple, tuple] = {}
+
+# Transient NWS API failures are retried with exponential backoff
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.2
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+# Stations failing this many scheduled calls in a row (5xx or network errors)
+# are not requested again until the cooldown has passed
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_COOLDOWN = 600
+_FAILURES: Dict[str, int] = {}
+_SKIP_UNTIL: Dict[str, float] = {}
+
+# Conditional request headers (If-None-Match/If-Modified-Since) from the last
+# 200 response of each station whose observation was written, so unchanged
+# observations come back as 304
+_VALIDATORS: Dict[str, Dict[str, str]] = {}
+
+# Returned by fetch_station_data when the latest observation was already fetched
+_UNCHANGED = object()
+
+# Unix epoch and one microsecond, for exact integer timestamp conversion
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Characters removed from the conditions description before it is used as a tag
+_SANITIZE_DESCRIPTION = str.maketrans("", "", ",=")
+
+# NWS observation property -> float field written for it
+_FLOAT_FIELDS = (
+    ("temperature", "temperature_c"),
+    ("dewpoint", "dewpoint_c"),
+    ("windSpeed", "wind_speed_kmh"),
+    ("windDirection", "wind_direction_degrees"),
+    ("windGust", "wind_gust_kmh"),
+    ("barometricPressure", "barometric_pressure_pa"),
+    ("visibility", "visibility_m"),
+    ("relativeHumidity", "relative_humidity_percent"),
+)
+
 
 def _exc(e: BaseException) -> str:
     """Return exception detail when full logging is enabled, else the type name."""
     return str(e) if _ENABLE_FULL_LOGGING else type(e).__name__
 
 
+def _record_failure(station_id: str) -> None:
+    """Count a failed fetch and start the station's cooldown once it fails repeatedly."""
+    failures = _FAILURES.get(station_id, 0) + 1
+    _FAILURES[station_id] = failures
+    if failures >= CIRCUIT_BREAKER_THRESHOLD:
+        _SKIP_UNTIL[station_id] = time.monotonic() + CIRCUIT_BREAKER_COOLDOWN
+
+
+def _record_success(station_id: str) -> None:
+    """Clear the failure history of a station that answered again."""
+    _FAILURES.pop(station_id, None)
+    _SKIP_UNTIL.pop(station_id, None)
+
+
+@lru_cache(maxsize=2 * MAX_STATIONS)
+def _observation_url(station_id: str) -> str:
+    """Return the latest-observation URL of a station, built once per station."""
+    return f"https://api.weather.gov/stations/{station_id}/observations/latest"
+
+
+class _CachedResolver(aiohttp.ThreadedResolver):
+    """Resolver that shares lookups across sessions for DNS_CACHE_TTL seconds.
+
+    Each scheduled call creates a new connector, whose own DNS cache would
+    otherwise start empty every tick.
+    """
+
+    async def resolve(
+        self, host: str, port: int = 0, family: int = socket.AF_INET
+    ) -> List[Dict[str, Any]]:
+        key = (host, port, family)
+        cached = _DNS_CACHE.get(key)
+        now = time.monotonic()
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        addresses = await super().resolve(host, port, family)
+        _DNS_CACHE[key] = (now + DNS_CACHE_TTL, addresses)
+        return addresses
+
+
 def process_scheduled_call(
     influxdb3_local, call_time: datetime, args: Optional[Dict[str, Any]] = None
 ) -> None:
@@ -69,7 +173,7 @@ def process_scheduled_call(
             - user_agent: Custom User-Agent for API requests (default: 'InfluxDB3-NWS-Plugin')
             - use_data_timestamp: Use timestamp from weather data instead of current time (default: 'true')
     """
-    task_id = str(uuid.uuid4())
+    task_id = os.urandom(6).hex()
 
     global _ENABLE_FULL_LOGGING
     _ENABLE_FULL_LOGGING = (
@@ -102,11 +206,20 @@ def process_scheduled_call(
         if "user_agent" in args:
             user_agent = args["user_agent"]
         if "stations" in args:
-            # Parse comma-separated station list
-            stations = [s.strip() for s in args["stations"].split(".") if s.strip()]
+            # Parse dot-separated station list, dropping empty entries
+            stations = list(
+                filter(None, (s.strip() for s in args["stations"].split(".")))
+            )
         if "use_data_timestamp" in args:
             use_data_timestamp = args["use_data_timestamp"].lower() == "true"
 
+    if len(stations) > MAX_STATIONS:
+        influxdb3_local.warn(
+            f"[{task_id}] {len(stations)} stations configured, "
+            f"only the first {MAX_STATIONS} will be fetched"
+        )
+        stations = stations[:MAX_STATIONS]
+
     influxdb3_local.info(
         f"[{task_id}] NWS Plugin started at {call_time}"
     )
@@ -117,51 +230,67 @@ def process_scheduled_call(
     # Track statistics
     success_count = 0
     error_count = 0
+    cached_count = 0
+    lines = []
+    # Validators of this call's responses, kept only once their lines are written
+    validators: Dict[str, Dict[str, str]] = {}
 
     try:
-        # Fetch data from stations in parallel using ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=min(len(stations), 5)) as executor:
-            # Submit all fetch tasks
-            futures = {
-                executor.submit(
-                    fetch_station_data, influxdb3_local, station_id, user_agent, task_id
-                ): station_id
-                for station_id in stations
-            }
-
-            # Process results as they complete
-            for future in as_completed(futures):
-                station_id = futures[future]
-                try:
-                    data = future.result()
-
-                    if data:
-                        write_weather_data(
-                            influxdb3_local,
-                            measurement_name,
-                            station_id,
-                            data,
-                            task_id,
-                            use_data_timestamp,
-                        )
-                        success_count += 1
-                    else:
-                        error_count += 1
+        # Fetch and parse all stations concurrently on a single event loop
+        results = asyncio.run(
+            fetch_all_stations(
+                influxdb3_local,
+                stations,
+                measurement_name,
+                user_agent,
+                task_id,
+                set_data_timestamp if use_data_timestamp else keep_write_time,
+                validators if use_data_timestamp else None,
+            )
+        )
 
-                except Exception as e:
-                    influxdb3_local.error(
-                        f"[{task_id}] Error processing station {station_id}: {_exc(e)}"
-                    )
+        # Process results in station order
+        for station_id, line in zip(stations, results):
+            try:
+                if isinstance(line, Exception):
+                    validators.pop(station_id, None)
+                    raise line
+
+                if line is _UNCHANGED:
+                    cached_count += 1
+                elif line is not None:
+                    lines.append(line)
+                    success_count += 1
+                else:
                     error_count += 1
 
-        # Write plugin statistics
-        write_plugin_stats(
-            influxdb3_local, success_count, error_count, len(stations), task_id
+            except Exception as e:
+                influxdb3_local.error(
+                    f"[{task_id}] Error processing station {station_id}: {_exc(e)}"
+                )
+                error_count += 1
+
+        # Plugin statistics go out with the station observations
+        stats_line = build_plugin_stats_line(
+            influxdb3_local,
+            success_count,
+            error_count,
+            len(stations),
+            task_id,
+            cached_count,
         )
+        if stats_line is not None:
+            lines.append(stats_line)
+
+        # Write everything once all stations have been fetched and parsed
+        for line in lines:
+            influxdb3_local.write(line)
+        _VALIDATORS.update(validators)
 
         # Log summary
         influxdb3_local.info(
-            f"[{task_id}] NWS Plugin completed: {success_count} successful, {error_count} errors"
+            f"[{task_id}] NWS Plugin completed: {success_count} successful, "
+            f"{cached_count} unchanged, {error_count} errors"
         )
 
     except Exception as e:
@@ -170,55 +299,203 @@ def process_scheduled_call(
         )
 
 
-def fetch_station_data(
-    influxdb3_local, station_id: str, user_agent: str, task_id: str
-) -> Optional[Dict[str, Any]]:
+async def fetch_all_stations(
+    influxdb3_local,
+    stations: List[str],
+    measurement_name: str,
+    user_agent: str,
+    task_id: str,
+    set_time: Callable[..., bool],
+    validators: Optional[Dict[str, Dict[str, str]]] = None,
+) -> List[Any]:
+    """
+    Fetch and parse latest observations from all stations concurrently.
+
+    Args:
+        influxdb3_local: InfluxDB API for logging
+        stations: NWS station identifiers
+        measurement_name: Name of the measurement to write to
+        user_agent: User-Agent header for the requests
+        task_id: String identifier for logging context
+        set_time: Timestamp policy passed to build_weather_line
+        validators: If given, skip observations unchanged since the last written
+            fetch and collect the validators of the new ones
+
+    Returns:
+        list: Per-station result of fetch_station_line (or the raised exception),
+        in the same order as stations
+    """
+    headers = {"User-Agent": user_agent, "Accept": "application/json"}
+    connector = aiohttp.TCPConnector(
+        limit_per_host=MAX_CONNECTIONS_PER_HOST, resolver=_CachedResolver()
+    )
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+        return await asyncio.gather(
+            *(
+                fetch_station_line(
+                    influxdb3_local,
+                    session,
+                    measurement_name,
+                    station_id,
+                    task_id,
+                    set_time,
+                    validators,
+                )
+                for station_id in stations
+            ),
+            return_exceptions=True,
+        )
+
+
+async def fetch_station_line(
+    influxdb3_local,
+    session: aiohttp.ClientSession,
+    measurement_name: str,
+    station_id: str,
+    task_id: str,
+    set_time: Callable[..., bool],
+    validators: Optional[Dict[str, Dict[str, str]]] = None,
+) -> Any:
+    """
+    Fetch a station's latest observation and parse it as soon as it arrives.
+
+    Parsing one station runs while the requests for other stations are still
+    in flight, so only the writes are left once all stations have completed.
+
+    Args:
+        influxdb3_local: InfluxDB API object
+        session: HTTP session carrying the User-Agent header
+        measurement_name: Name of the measurement to write to
+        station_id: NWS station identifier (e.g., 'KSEA')
+        task_id: String identifier for logging context
+        set_time: Timestamp policy passed to build_weather_line
+        validators: If given, skip observations unchanged since the last written
+            fetch; the station's validators are only left in it when a line
+            was built
+
+    Returns:
+        LineBuilder: Weather observation line, _UNCHANGED if the observation has
+        not changed since the last fetch, or None if fetch or parsing failed
+    """
+    data = await fetch_station_data(
+        influxdb3_local, session, station_id, task_id, validators
+    )
+    if data is _UNCHANGED:
+        return data
+    if not data:
+        return None
+
+    line = build_weather_line(
+        influxdb3_local,
+        measurement_name,
+        station_id,
+        data,
+        task_id,
+        set_time,
+    )
+    if line is None and validators is not None:
+        # Fetch the skipped observation again rather than treating it as unchanged
+        validators.pop(station_id, None)
+    return line
+
+
+async def fetch_station_data(
+    influxdb3_local,
+    session: aiohttp.ClientSession,
+    station_id: str,
+    task_id: str,
+    validators: Optional[Dict[str, Dict[str, str]]] = None,
+) -> Any:
     """
     Fetch latest weather observations from a NWS station.
 
     Args:
         influxdb3_local: InfluxDB API for logging
+        session: HTTP session carrying the User-Agent header (required by NWS API)
         station_id: NWS station identifier (e.g., 'KSEA')
-        user_agent: User-Agent header for the request
         task_id: String identifier for logging context
+        validators: If given, send the validators of the last written response
+            so an unchanged observation is answered with 304, and store the
+            new response's validators in it
 
     Returns:
-        dict: Weather observation data or None if fetch failed
+        dict: Weather observation data, _UNCHANGED if the observation has not
+        changed since the last fetch, or None if fetch failed
     """
-    url = f"https://api.weather.gov/stations/{station_id}/observations/latest"
+    if _SKIP_UNTIL.get(station_id, 0) > time.monotonic():
+        influxdb3_local.warn(
+            f"[{task_id}] Skipping {station_id} after "
+            f"{_FAILURES[station_id]} consecutive failures"
+        )
+        return None
+
+    url = _observation_url(station_id)
+    request_headers = _VALIDATORS.get(station_id) if validators is not None else None
 
     try:
-        # Create request with User-Agent header (required by NWS API)
-        req = Request(url)
-        req.add_header("User-Agent", user_agent)
-        req.add_header("Accept", "application/json")
-
-        # Fetch data with timeout
-        with urlopen(req, timeout=10) as response:
-            if response.status == 200:
-                data = json.loads(response.read().decode("utf-8"))
-                influxdb3_local.info(
-                    f"[{task_id}] Successfully fetched data from {station_id}"
-                )
-                return data
-            else:
-                influxdb3_local.warn(
-                    f"[{task_id}] Station {station_id} returned status {response.status}"
-                )
-                return None
-
-    except HTTPError as e:
-        if e.code == 404:
-            influxdb3_local.warn(f"[{task_id}] Station {station_id} not found (404)")
-        elif e.code == 500:
-            influxdb3_local.warn(f"[{task_id}] NWS API error for {station_id} (500)")
-        else:
-            influxdb3_local.error(
-                f"[{task_id}] HTTP error {e.code} for station {station_id}"
-            )
-        return None
+        for attempt in range(MAX_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+
+            try:
+                # Fetch data with timeout
+                async with session.get(
+                    url, headers=request_headers, timeout=REQUEST_TIMEOUT
+                ) as response:
+                    if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                        continue
+
+                    if response.status == 200:
+                        # Parse the raw bytes; NWS serves application/geo+json
+                        data = _json_loads(await response.read())
+                        if validators is not None:
+                            validators[station_id] = {
+                                request_header: response.headers[response_header]
+                                for request_header, response_header in (
+                                    ("If-None-Match", "ETag"),
+                                    ("If-Modified-Since", "Last-Modified"),
+                                )
+                                if response_header in response.headers
+                            }
+                        _record_success(station_id)
+                        influxdb3_local.info(
+                            f"[{task_id}] Successfully fetched data from {station_id}"
+                        )
+                        return data
+                    elif response.status == 304:
+                        _record_success(station_id)
+                        influxdb3_local.info(
+                            f"[{task_id}] No new observation from {station_id}"
+                        )
+                        return _UNCHANGED
+                    elif response.status == 404:
+                        influxdb3_local.warn(
+                            f"[{task_id}] Station {station_id} not found (404)"
+                        )
+                    elif response.status == 500:
+                        influxdb3_local.warn(
+                            f"[{task_id}] NWS API error for {station_id} (500)"
+                        )
+                    elif response.status >= 400:
+                        influxdb3_local.error(
+                            f"[{task_id}] HTTP error {response.status} for station {station_id}"
+                        )
+                    else:
+                        influxdb3_local.warn(
+                            f"[{task_id}] Station {station_id} returned status {response.status}"
+                        )
+
+                    if response.status >= 500:
+                        _record_failure(station_id)
+                    return None
 
-    except URLError as e:
+            except aiohttp.ServerDisconnectedError:
+                # A pooled keep-alive connection was closed by the server
+                if attempt == MAX_RETRIES:
+                    raise
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        _record_failure(station_id)
         influxdb3_local.error(
             f"[{task_id}] Network error fetching {station_id}: {_exc(e)}"
         )
@@ -237,16 +514,48 @@ def fetch_station_data(
         return None
 
 
-def write_weather_data(
+def set_data_timestamp(
+    influxdb3_local, line, properties: Dict[str, Any], station_id: str, task_id: str
+) -> bool:
+    """
+    Set the line timestamp from the observation time.
+
+    Returns:
+        bool: False if the observation has no usable timestamp and should be skipped
+    """
+    timestamp_str = properties.get("timestamp")
+    if not timestamp_str:
+        influxdb3_local.warn(f"[{task_id}] No timestamp for {station_id}, skipping")
+        return False
+
+    timestamp_ns = parse_timestamp_to_nanoseconds(timestamp_str)
+    if timestamp_ns is None:
+        influxdb3_local.warn(
+            f"[{task_id}] Failed to parse timestamp for {station_id}, skipping"
+        )
+        return False
+
+    line.time_ns(timestamp_ns)
+    return True
+
+
+def keep_write_time(
+    influxdb3_local, line, properties: Dict[str, Any], station_id: str, task_id: str
+) -> bool:
+    """Leave the line without a timestamp so the write time is used."""
+    return True
+
+
+def build_weather_line(
     influxdb3_local,
     measurement_name: str,
     station_id: str,
     data: Dict[str, Any],
     task_id: str,
-    use_data_timestamp: bool = True,
-) -> None:
+    set_time: Callable[..., bool] = set_data_timestamp,
+):
     """
-    Parse NWS API response and write to InfluxDB.
+    Parse NWS API response into a line for InfluxDB.
 
     Args:
         influxdb3_local: InfluxDB API object
@@ -254,57 +563,36 @@ def write_weather_data(
         station_id: Station identifier for tagging
         data: Raw API response data
         task_id: String identifier for logging context
-        use_data_timestamp: If True, use timestamp from weather data; if False, use current time
+        set_time: set_data_timestamp to use the timestamp from weather data, or
+            keep_write_time to use the current time
+
+    Returns:
+        LineBuilder: Weather observation line or None if the data was skipped
     """
     try:
-        properties = data.get("properties", {})
+        properties = data.get("properties") or {}
+        pget = properties.get
 
         # Extract location information
-        geometry = data.get("geometry", {})
-        coordinates = geometry.get("coordinates", [])
-
-        # Extract weather values
-        temp_c = extract_value(properties.get("temperature"))
-        dewpoint_c = extract_value(properties.get("dewpoint"))
-        wind_speed_kmh = extract_value(properties.get("windSpeed"))
-        wind_direction = extract_value(properties.get("windDirection"))
-        wind_gust_kmh = extract_value(properties.get("windGust"))
-        barometric_pressure_pa = extract_value(properties.get("barometricPressure"))
-        visibility_m = extract_value(properties.get("visibility"))
-        relative_humidity = extract_value(properties.get("relativeHumidity"))
-        text_description = properties.get("textDescription", "N/A")
+        geometry = data.get("geometry") or {}
+        coordinates = geometry.get("coordinates") or []
+
+        text_description = pget("textDescription", "N/A")
 
         # Build line protocol
         line = LineBuilder(measurement_name)
 
-        # Set timestamp if using data timestamp
-        if use_data_timestamp:
-            # Extract and parse timestamp
-            timestamp_str = properties.get("timestamp")
-            if not timestamp_str:
-                influxdb3_local.warn(
-                    f"[{task_id}] No timestamp for {station_id}, skipping"
-                )
-                return
-
-            timestamp_ns = parse_timestamp_to_nanoseconds(timestamp_str)
-            if timestamp_ns is None:
-                influxdb3_local.warn(
-                    f"[{task_id}] Failed to parse timestamp for {station_id}, skipping"
-                )
-                return
-
-            line.time_ns(timestamp_ns)
+        # Set timestamp according to the trigger's use_data_timestamp policy
+        if not set_time(influxdb3_local, line, properties, station_id, task_id):
+            return None
 
         # Add tags
         line.tag("station_id", station_id)
-        line.tag("station", properties.get("station", "").split("/")[-1])
+        line.tag("station", (pget("station") or "").split("/")[-1])
 
         if text_description and text_description != "N/A":
             # Sanitize description for use as tag (remove special characters)
-            safe_description = (
-                text_description.replace(",", "").replace("=", "").strip()
-            )
+            safe_description = text_description.translate(_SANITIZE_DESCRIPTION).strip()
             if safe_description:
                 line.tag("conditions", safe_description[:50])  # Limit length
 
@@ -313,48 +601,39 @@ def write_weather_data(
             line.tag("longitude", f"{coordinates[0]:.4f}")
             line.tag("latitude", f"{coordinates[1]:.4f}")
 
+        field_count = 0
+
         # Add elevation if available
-        elevation = properties.get("elevation", {}).get("value")
+        elevation = extract_value(pget("elevation"))
         if elevation is not None:
-            line.float64_field("elevation_m", float(elevation))
+            line.float64_field("elevation_m", elevation)
+            field_count += 1
 
         # Add fields
-        if temp_c is not None:
-            line.float64_field("temperature_c", temp_c)
-
-        if dewpoint_c is not None:
-            line.float64_field("dewpoint_c", dewpoint_c)
-
-        if wind_speed_kmh is not None:
-            line.float64_field("wind_speed_kmh", wind_speed_kmh)
-
-        if wind_direction is not None:
-            line.float64_field("wind_direction_degrees", wind_direction)
-
-        if wind_gust_kmh is not None:
-            line.float64_field("wind_gust_kmh", wind_gust_kmh)
-
-        if barometric_pressure_pa is not None:
-            line.float64_field("barometric_pressure_pa", barometric_pressure_pa)
-
-        if visibility_m is not None:
-            line.float64_field("visibility_m", visibility_m)
-
-        if relative_humidity is not None:
-            line.float64_field("relative_humidity_percent", relative_humidity)
-
-        # Write to InfluxDB
-        influxdb3_local.write(line)
+        for api_key, field_name in _FLOAT_FIELDS:
+            value = extract_value(pget(api_key))
+            if value is not None:
+                line.float64_field(field_name, value)
+                field_count += 1
+
+        if field_count == 0:
+            influxdb3_local.warn(
+                f"[{task_id}] No observed values for {station_id}, skipping"
+            )
+            return None
 
         influxdb3_local.info(
-            f"[{task_id}] Wrote weather data for {station_id}: "
-            f"temp={temp_c}°C, humidity={relative_humidity}%"
+            f"[{task_id}] Parsed weather data for {station_id}: "
+            f"temp={extract_value(pget('temperature'))}°C, "
+            f"humidity={extract_value(pget('relativeHumidity'))}%"
         )
+        return line
 
     except Exception as e:
         influxdb3_local.error(
-            f"[{task_id}] Error writing data for {station_id}: {_exc(e)}"
+            f"[{task_id}] Error parsing data for {station_id}: {_exc(e)}"
         )
+        return None
 
 
 def extract_value(value_obj: Optional[Dict[str, Any]]) -> Optional[float]:
@@ -394,22 +673,24 @@ def parse_timestamp_to_nanoseconds(timestamp_str: str) -> Optional[int]:
     """
     try:
         dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        # Convert to Unix timestamp in seconds, then to nanoseconds
-        timestamp_ns = int(dt.timestamp() * 1_000_000_000)
-        return timestamp_ns
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        # Integer microseconds since the epoch, then nanoseconds (no float rounding)
+        return (dt - _EPOCH) // _MICROSECOND * 1000
     except (ValueError, AttributeError):
         return None
 
 
-def write_plugin_stats(
+def build_plugin_stats_line(
     influxdb3_local,
     success_count: int,
     error_count: int,
     total_count: int,
     task_id: str,
-) -> None:
+    cached_count: int = 0,
+):
     """
-    Write plugin execution statistics to a separate measurement.
+    Build plugin execution statistics for a separate measurement.
 
     Args:
         influxdb3_local: InfluxDB API object
@@ -417,20 +698,27 @@ def write_plugin_stats(
         error_count: Number of failed station fetches
         total_count: Total number of stations attempted
         task_id: String identifier for logging context
+        cached_count: Number of stations whose observation had not changed
+
+    Returns:
+        LineBuilder: Statistics line or None if it could not be built
     """
     try:
         line = LineBuilder("nws_plugin_stats")
         line.tag("plugin", "nws_weather_sampler")
         line.int64_field("success_count", success_count)
         line.int64_field("error_count", error_count)
+        line.int64_field("cached_count", cached_count)
         line.int64_field("total_count", total_count)
         line.float64_field(
             "success_rate",
-            (success_count / total_count * 100) if total_count > 0 else 0,
+            ((success_count + cached_count) / total_count * 100)
+            if total_count > 0
+            else 0,
         )
         line.string_field("task_id", task_id)
-
-        influxdb3_local.write(line)
+        return line
 
     except Exception as e:
-        influxdb3_local.error(f"[{task_id}] Error writing plugin stats: {_exc(e)}")
+        influxdb3_local.error(f"[{task_id}] Error building plugin stats: {_exc(e)}")
+        return None
@@ -15,9 +15,11 @@ eliminating the need for manual configuration updates when CLI or API changes.
 """
 
 import argparse
+import json
 import os
 import re
 import sys
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 from typing import NamedTuple
@@ -26,15 +28,113 @@ from typing import NamedTuple
 try:
     import yaml
     YAML_AVAILABLE = True
+    # libyaml-backed loader when PyYAML was built with it; same semantics as safe_load
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     YAML_AVAILABLE = False
 
+# Patterns used for every README, command, and reference file, compiled once
+# Markdown options table row: | short | --long | description |
+_OPTIONS_ROW_RE = re.compile(r'\|\s*`?(-\w)?`?\s*\|\s*`?(--[\w-]+)`?\s*\|\s*([^|]+)\|')
+_DEPRECATED_REPLACEMENT_RE = re.compile(r'use\s+`?(--[\w-]+)`?\s+instead', re.IGNORECASE)
+# OpenAPI paths-level entry like "  /api/v3/write:" and the next top-level key
+_OPENAPI_PATH_RE = re.compile(r'^  (/[a-zA-Z0-9_/{}-]+):\s*$')
+_TOP_LEVEL_KEY_RE = re.compile(r'^[a-z]')
+_PATH_PARAM_RE = re.compile(r'\{[^}]+\}')
+# Code blocks with optional language specifier
+_CODE_BLOCK_RE = re.compile(r'```(\w*)\n(.*?)```', re.DOTALL)
+_CLI_SUBCOMMAND_RE = re.compile(r'influxdb3\s+(\w+)(?:\s+(\w+))?')
+_TRIGGER_SPEC_QUOTED_RE = re.compile(r'--trigger-spec\s+"([^"]+)"')
+_TRIGGER_SPEC_UNQUOTED_RE = re.compile(r'--trigger-spec\s+(\S+)')
+# Endpoint paths in curl commands or URLs, tried in order
+_API_ENDPOINT_RES = (
+    re.compile(r'https?://[^/\s]+(/api/v[0-9]/[^\s"\']+)'),  # Full URL
+    re.compile(r'https?://[^/\s]+(/[^\s"\']+)'),  # Any path after host
+    re.compile(r'"(/api/v[0-9]/[^\s"\']+)"'),  # Quoted path
+    re.compile(r'\s(/api/v[0-9]/\S+)'),  # Unquoted path
+)
+# CLI commands whose second word is a subcommand (e.g. "create trigger")
+_CLI_SUBCOMMAND_PARENTS = frozenset(
+    ('create', 'delete', 'update', 'show', 'enable', 'disable', 'install', 'test')
+)
+# Part of every parsed-reference cache key; bump when the docs-v2 parsing changes
+CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=4096)
+def _cli_subcommand(command: str) -> str:
+    """Return the subcommand of an influxdb3 command; READMEs repeat the same commands."""
+    match = _CLI_SUBCOMMAND_RE.search(command)
+    if match:
+        cmd = match.group(1)
+        subcmd = match.group(2)
+        if subcmd and cmd in _CLI_SUBCOMMAND_PARENTS:
+            return f"{cmd} {subcmd}"
+        return cmd
+    return ""
+
+
+@lru_cache(maxsize=4096)
+def _api_endpoint(call: str) -> str:
+    """Return the endpoint path of a curl command or URL; READMEs repeat the same calls."""
+    # Match patterns like /api/v3/write or http://localhost:8181/api/v3/query
+    for endpoint_re in _API_ENDPOINT_RES:
+        match = endpoint_re.search(call)
+        if match:
+            endpoint = match.group(1)
+            # Clean up query params
+            endpoint = endpoint.split('?')[0]
+            return endpoint
+
+    return ""
+
+
+def _compile_any(needles) -> Optional[re.Pattern]:
+    """Compile a pattern matching any of the literal strings, or None if there are none."""
+    needles = list(needles)
+    if not needles:
+        return None
+    return re.compile('|'.join(map(re.escape, needles)))
+
+
+def _cache_file(name: str) -> Path:
+    """Return the path of a parsed-reference cache file."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "influxdb3_plugins" / name
+
+
+def _load_cache(name: str, key: str):
+    """Return the cached value stored under key, or None if missing or stale."""
+    try:
+        data = json.loads(_cache_file(name).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("key") != key:
+        return None
+    return data.get("value")
+
+
+def _store_cache(name: str, key: str, value) -> None:
+    """Atomically write value to the cache; failures only cost a re-parse next run."""
+    cache_path = _cache_file(name)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps({"key": key, "value": value}), encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
 
 class CLIReferenceParser:
     """Parse docs-v2 CLI reference markdown files to extract valid options."""
 
-    def __init__(self, docs_v2_path: Path = None):
+    def __init__(self, docs_v2_path: Path = None, use_cache: bool = True):
         self.docs_v2_path = docs_v2_path
+        self.use_cache = use_cache
         self.cli_ref_path = None
         if docs_v2_path:
             self.cli_ref_path = docs_v2_path / "content" / "shared" / "influxdb3-cli"
@@ -53,9 +153,7 @@ class CLIReferenceParser:
 
         # Match table rows: | short | --long | description |
         # Pattern handles optional short option and various description formats
-        row_pattern = r'\|\s*`?(-\w)?`?\s*\|\s*`?(--[\w-]+)`?\s*\|\s*([^|]+)\|'
-
-        for match in re.finditer(row_pattern, content):
+        for match in _OPTIONS_ROW_RE.finditer(content):
             short_opt = match.group(1)
             long_opt = match.group(2)
             description = match.group(3).strip()
@@ -66,7 +164,7 @@ class CLIReferenceParser:
                 # Check for deprecated marker
                 if 'Deprecated' in description or 'deprecated' in description:
                     # Extract replacement suggestion
-                    replacement_match = re.search(r'use\s+`?(--[\w-]+)`?\s+instead', description, re.IGNORECASE)
+                    replacement_match = _DEPRECATED_REPLACEMENT_RE.search(description)
                     if replacement_match:
                         replacement = replacement_match.group(1)
                         deprecated_options[long_opt] = f"Use {replacement} instead of {long_opt} (deprecated)"
@@ -122,7 +220,26 @@ class CLIReferenceParser:
         if not self.cli_ref_path or not self.cli_ref_path.exists():
             return all_deprecated
 
-        for md_file in self.cli_ref_path.rglob("*.md"):
+        md_files = sorted(self.cli_ref_path.rglob("*.md"))
+
+        # Reuse the previous scan while no reference file was added, removed, or modified
+        cache_key = None
+        if self.use_cache:
+            try:
+                stats = [md_file.stat() for md_file in md_files]
+                cache_key = (
+                    f"v{CACHE_VERSION}:{self.cli_ref_path.resolve()}:{len(stats)}:"
+                    f"{max((st.st_mtime_ns for st in stats), default=0)}:"
+                    f"{sum(st.st_size for st in stats)}"
+                )
+            except OSError:
+                cache_key = None
+            if cache_key:
+                cached = _load_cache("cli_deprecated_options.json", cache_key)
+                if isinstance(cached, dict):
+                    return cached
+
+        for md_file in md_files:
             try:
                 content = md_file.read_text(encoding='utf-8')
                 _, deprecated = self._parse_options_table(content)
@@ -130,15 +247,22 @@ class CLIReferenceParser:
             except Exception:
                 continue
 
+        if cache_key:
+            _store_cache("cli_deprecated_options.json", cache_key, all_deprecated)
+
         return all_deprecated
 
 
 class OpenAPIParser:
     """Parse OpenAPI specification to extract valid API endpoints."""
 
-    def __init__(self, openapi_path: Path = None):
+    def __init__(self, openapi_path: Path = None, use_cache: bool = True):
         self.openapi_path = openapi_path
+        self.use_cache = use_cache
         self._endpoints_cache = None
+        self._endpoint_validity = {}
+        self._path_prefixes = None
+        self._template_re = None
 
     def get_valid_endpoints(self) -> list[str]:
         """Extract all valid API endpoints from OpenAPI spec."""
@@ -148,20 +272,39 @@ class OpenAPIParser:
         if not self.openapi_path or not self.openapi_path.exists():
             return []
 
-        try:
-            content = self.openapi_path.read_text(encoding='utf-8')
+        # Reuse endpoints parsed by a previous run while the spec file is unchanged
+        cache_key = None
+        if self.use_cache:
+            try:
+                stat = self.openapi_path.stat()
+                cache_key = (
+                    f"v{CACHE_VERSION}:{'yaml' if YAML_AVAILABLE else 'regex'}:"
+                    f"{self.openapi_path.resolve()}:"
+                    f"{stat.st_mtime_ns}:{stat.st_size}"
+                )
+            except OSError:
+                cache_key = None
+            if cache_key:
+                cached = _load_cache("openapi_endpoints.json", cache_key)
+                if isinstance(cached, list):
+                    self._endpoints_cache = cached
+                    return cached
 
+        try:
             if YAML_AVAILABLE:
-                # Use proper YAML parsing if available
-                spec = yaml.safe_load(content)
+                # Use proper YAML parsing if available, straight from the file
+                with self.openapi_path.open('rb') as f:
+                    spec = yaml.load(f, Loader=_YamlLoader)
                 if spec and 'paths' in spec:
                     self._endpoints_cache = list(spec['paths'].keys())
+                    if cache_key:
+                        _store_cache("openapi_endpoints.json", cache_key, self._endpoints_cache)
                     return self._endpoints_cache
             else:
                 # Fallback: regex parsing for paths section
+                content = self.openapi_path.read_text(encoding='utf-8')
                 endpoints = []
                 # Match lines like "  /api/v3/write:" at the paths level
-                path_pattern = r'^  (/[a-zA-Z0-9_/{}-]+):\s*$'
                 in_paths = False
 
                 for line in content.split('\n'):
@@ -170,13 +313,15 @@ class OpenAPIParser:
                         continue
                     if in_paths:
                         # Stop at next top-level key
-                        if re.match(r'^[a-z]', line):
+                        if _TOP_LEVEL_KEY_RE.match(line):
                             break
-                        match = re.match(path_pattern, line)
+                        match = _OPENAPI_PATH_RE.match(line)
                         if match:
                             endpoints.append(match.group(1))
 
                 self._endpoints_cache = endpoints
+                if cache_key:
+                    _store_cache("openapi_endpoints.json", cache_key, endpoints)
                 return endpoints
 
         except Exception:
@@ -184,6 +329,22 @@ class OpenAPIParser:
 
         return []
 
+    def _build_matcher(self, valid_endpoints: list[str]) -> None:
+        """Precompile the spec paths into a prefix tuple and one template regex."""
+        # Every spec path also accepts any endpoint it is a prefix of
+        self._path_prefixes = tuple(valid.rstrip('/') for valid in valid_endpoints)
+
+        # Handle path parameters like {request_path}
+        templates = [
+            _PATH_PARAM_RE.sub(r'[^/]+', valid)
+            for valid in valid_endpoints
+            if _PATH_PARAM_RE.search(valid)
+        ]
+        if templates:
+            self._template_re = re.compile(
+                '^(?:' + '|'.join(f'(?:{t})' for t in templates) + ')$'
+            )
+
     def is_valid_endpoint(self, endpoint: str) -> bool:
         """Check if an endpoint path is valid according to OpenAPI spec."""
         valid_endpoints = self.get_valid_endpoints()
@@ -195,13 +356,17 @@ class OpenAPIParser:
         # Normalize the endpoint
         endpoint = endpoint.rstrip('/')
 
-        for valid in valid_endpoints:
-            # Handle path parameters like {request_path}
-            pattern = re.sub(r'\{[^}]+\}', r'[^/]+', valid)
-            if re.match(f"^{pattern}$", endpoint) or endpoint.startswith(valid.rstrip('/')):
-                return True
+        # READMEs reference the same few endpoints many times
+        is_valid = self._endpoint_validity.get(endpoint)
+        if is_valid is None:
+            if self._path_prefixes is None:
+                self._build_matcher(valid_endpoints)
+            is_valid = endpoint.startswith(self._path_prefixes) or bool(
+                self._template_re and self._template_re.match(endpoint)
+            )
+            self._endpoint_validity[endpoint] = is_valid
 
-        return False
+        return is_valid
 
 
 # Fallback configuration when docs-v2/OpenAPI not available
@@ -266,18 +431,29 @@ class InfluxDB3Validator:
     - OpenAPI specification (valid API endpoints)
     """
 
-    def __init__(self, config: dict = None, docs_v2_path: Path = None, openapi_path: Path = None):
+    def __init__(self, config: dict = None, docs_v2_path: Path = None, openapi_path: Path = None,
+                 use_cache: bool = True):
         self.config = config or DEFAULT_CONFIG
         self.cli_config = self.config.get("cli", {})
         self.api_config = self.config.get("api", {})
         self.trigger_spec_config = self.config.get("trigger_specs", {})
 
+        # Trigger spec formats as (type, compiled pattern), compiled once per validator
+        self._trigger_spec_formats = [
+            (format_def["type"], re.compile(format_def["pattern"]))
+            for format_def in self.trigger_spec_config.get("valid_formats", [])
+        ]
+
         # Dynamic parsers for docs-v2 and OpenAPI
-        self.cli_parser = CLIReferenceParser(docs_v2_path)
-        self.openapi_parser = OpenAPIParser(openapi_path)
+        self.cli_parser = CLIReferenceParser(docs_v2_path, use_cache)
+        self.openapi_parser = OpenAPIParser(openapi_path, use_cache)
 
         # Merge dynamically-parsed deprecated options with config
         self._dynamic_deprecated = None
+        self._dynamic_deprecated_re = None
+
+        # Single-pass prefilter for the per-endpoint deprecation checks
+        self._deprecated_endpoints_re = _compile_any(self.api_config.get("deprecated_endpoints", {}))
 
     def extract_code_blocks(self, readme_content: str) -> list[tuple[str, str, int]]:
         """
@@ -288,9 +464,7 @@ class InfluxDB3Validator:
         blocks = []
 
         # Match code blocks with optional language specifier
-        pattern = r'```(\w*)\n(.*?)```'
-
-        for match in re.finditer(pattern, readme_content, re.DOTALL):
+        for match in _CODE_BLOCK_RE.finditer(readme_content):
             language = match.group(1) or "unknown"
             content = match.group(2)
             line_num = readme_content[:match.start()].count('\n') + 1
@@ -298,78 +472,53 @@ class InfluxDB3Validator:
 
         return blocks
 
-    def extract_cli_commands(self, block_content: str, block_start: int) -> list[tuple[str, int]]:
-        """Extract influxdb3 CLI commands from a code block."""
+    def _extract_commands(self, block_content: str, block_start: int,
+                          needles: tuple[str, ...]) -> list[tuple[str, int]]:
+        """Join backslash-continued lines of a code block and keep commands containing any needle."""
         commands = []
 
-        if 'influxdb3' not in block_content:
+        if not any(needle in block_content for needle in needles):
             return commands
 
-        lines = block_content.split('\n')
         current_cmd = []
         cmd_start_line = block_start
 
-        for i, line in enumerate(lines):
+        for i, line in enumerate(block_content.split('\n')):
             stripped = line.strip()
 
             # Skip comments and empty lines
-            if stripped.startswith('#') or not stripped:
+            if not stripped or stripped[0] == '#':
                 if not current_cmd:
                     cmd_start_line = block_start + i + 1
                 continue
 
-            current_cmd.append(stripped.rstrip('\\').strip())
+            if stripped[-1] == '\\':
+                current_cmd.append(stripped.rstrip('\\').strip())
+                continue
 
-            # If line doesn't end with backslash, command is complete
-            if not line.rstrip().endswith('\\'):
-                full_cmd = ' '.join(current_cmd)
-                if 'influxdb3' in full_cmd:
-                    commands.append((full_cmd, cmd_start_line))
-                current_cmd = []
-                cmd_start_line = block_start + i + 2
+            # Line doesn't end with backslash, so the command is complete
+            current_cmd.append(stripped)
+            full_cmd = ' '.join(current_cmd)
+            if any(needle in full_cmd for needle in needles):
+                commands.append((full_cmd, cmd_start_line))
+            current_cmd = []
+            cmd_start_line = block_start + i + 2
 
         # Handle any remaining command
         if current_cmd:
             full_cmd = ' '.join(current_cmd)
-            if 'influxdb3' in full_cmd:
+            if any(needle in full_cmd for needle in needles):
                 commands.append((full_cmd, cmd_start_line))
 
         return commands
 
+    def extract_cli_commands(self, block_content: str, block_start: int) -> list[tuple[str, int]]:
+        """Extract influxdb3 CLI commands from a code block."""
+        return self._extract_commands(block_content, block_start, ('influxdb3',))
+
     def extract_api_calls(self, block_content: str, block_start: int) -> list[tuple[str, int]]:
         """Extract curl/API commands from a code block."""
-        calls = []
-
-        if 'curl' not in block_content and '/api/v3/' not in block_content:
-            return calls
-
-        lines = block_content.split('\n')
-        current_cmd = []
-        cmd_start_line = block_start
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-
-            if stripped.startswith('#') or not stripped:
-                if not current_cmd:
-                    cmd_start_line = block_start + i + 1
-                continue
-
-            current_cmd.append(stripped.rstrip('\\').strip())
-
-            if not line.rstrip().endswith('\\'):
-                full_cmd = ' '.join(current_cmd)
-                if 'curl' in full_cmd or '/api/v3/' in full_cmd:
-                    calls.append((full_cmd, cmd_start_line))
-                current_cmd = []
-                cmd_start_line = block_start + i + 2
-
-        if current_cmd:
-            full_cmd = ' '.join(current_cmd)
-            if 'curl' in full_cmd or '/api/v3/' in full_cmd:
-                calls.append((full_cmd, cmd_start_line))
-
-        return calls
+        return self._extract_commands(block_content, block_start, ('curl', '/api/v3/'))
 
     def _get_deprecated_options(self) -> dict[str, str]:
         """Get deprecated options from both config and dynamic parsing."""
@@ -382,19 +531,13 @@ class InfluxDB3Validator:
             # Add dynamically parsed deprecated options from docs-v2
             dynamic = self.cli_parser.get_all_deprecated_options()
             self._dynamic_deprecated.update(dynamic)
+            self._dynamic_deprecated_re = _compile_any(self._dynamic_deprecated)
 
         return self._dynamic_deprecated
 
     def _extract_cli_subcommand(self, command: str) -> str:
         """Extract the subcommand from an influxdb3 command (e.g., 'create trigger')."""
-        match = re.search(r'influxdb3\s+(\w+)(?:\s+(\w+))?', command)
-        if match:
-            cmd = match.group(1)
-            subcmd = match.group(2)
-            if subcmd and cmd in ['create', 'delete', 'update', 'show', 'enable', 'disable', 'install', 'test']:
-                return f"{cmd} {subcmd}"
-            return cmd
-        return ""
+        return _cli_subcommand(command)
 
     def validate_cli_command(self, command: str, readme_path: str = "") -> list[ValidationIssue]:
         """Validate a single influxdb3 CLI command."""
@@ -406,6 +549,10 @@ class InfluxDB3Validator:
         format_rules = self.cli_config.get("format_rules", {})
         recommended_patterns = self.cli_config.get("recommended_patterns", {})
 
+        # One scan rules out commands that contain no deprecated option at all
+        if not (self._dynamic_deprecated_re and self._dynamic_deprecated_re.search(command)):
+            deprecated_options = {}
+
         # Check for deprecated options
         for deprecated_opt, message in deprecated_options.items():
             if deprecated_opt in command:
@@ -453,25 +600,25 @@ class InfluxDB3Validator:
         issues = []
 
         # Extract trigger spec value
-        match = re.search(r'--trigger-spec\s+"([^"]+)"', command)
+        match = _TRIGGER_SPEC_QUOTED_RE.search(command)
         if not match:
-            match = re.search(r'--trigger-spec\s+(\S+)', command)
+            match = _TRIGGER_SPEC_UNQUOTED_RE.search(command)
 
         if not match:
             return issues
 
         spec_value = match.group(1)
-        valid_formats = self.trigger_spec_config.get("valid_formats", [])
+        valid_formats = self._trigger_spec_formats
 
         # Check if spec matches any valid format
         is_valid = False
-        for format_def in valid_formats:
-            if re.match(format_def["pattern"], spec_value):
+        for _, format_re in valid_formats:
+            if format_re.match(spec_value):
                 is_valid = True
                 break
 
         if not is_valid and valid_formats:
-            valid_types = [f["type"] for f in valid_formats]
+            valid_types = [format_type for format_type, _ in valid_formats]
             issues.append(ValidationIssue(
                 level="warning",
                 category="trigger_spec",
@@ -483,23 +630,7 @@ class InfluxDB3Validator:
 
     def _extract_api_endpoint(self, call: str) -> str:
         """Extract API endpoint path from a curl command or URL."""
-        # Match patterns like /api/v3/write or http://localhost:8181/api/v3/query
-        patterns = [
-            r'https?://[^/\s]+(/api/v[0-9]/[^\s"\']+)',  # Full URL
-            r'https?://[^/\s]+(/[^\s"\']+)',  # Any path after host
-            r'"(/api/v[0-9]/[^\s"\']+)"',  # Quoted path
-            r'\s(/api/v[0-9]/\S+)',  # Unquoted path
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, call)
-            if match:
-                endpoint = match.group(1)
-                # Clean up query params
-                endpoint = endpoint.split('?')[0]
-                return endpoint
-
-        return ""
+        return _api_endpoint(call)
 
     def validate_api_call(self, call: str, readme_path: str = "") -> list[ValidationIssue]:
         """Validate an API call (curl command or endpoint reference)."""
@@ -509,6 +640,10 @@ class InfluxDB3Validator:
         deprecated_endpoints = self.api_config.get("deprecated_endpoints", {})
         format_rules = self.api_config.get("format_rules", {})
 
+        # One scan rules out calls that contain no deprecated endpoint at all
+        if not (self._deprecated_endpoints_re and self._deprecated_endpoints_re.search(call)):
+            deprecated_endpoints = {}
+
         # Check for deprecated endpoints (from config)
         for endpoint, info in deprecated_endpoints.items():
             if endpoint in call:
@@ -686,6 +821,11 @@ def main():
         action="store_true",
         help="Show detailed output including command counts"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse docs-v2 and the OpenAPI spec instead of using cached results"
+    )
     parser.add_argument(
         "--cli-only",
         action="store_true",
@@ -734,7 +874,8 @@ def main():
     validator = InfluxDB3Validator(
         config=DEFAULT_CONFIG,
         docs_v2_path=docs_v2_path,
-        openapi_path=openapi_path
+        openapi_path=openapi_path,
+        use_cache=not args.no_cache
     )
 
     # Find README files to validate